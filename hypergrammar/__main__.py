@@ -0,0 +1,5 @@
+import sys
+
+from hypergrammar.cli import main
+
+sys.exit(main())
@@ -0,0 +1,238 @@
+import argparse
+import importlib
+import json
+import sys
+import threading
+import time
+from typing import Any, Mapping, Optional, Sequence, TextIO
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.events import GraphDelta
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.mesh_io import load_mesh, save_mesh
+from hypergrammar.parallel import ConcurrentRewriter
+from hypergrammar.productions.i_prod import IProd
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.productions.prod_10 import Prod10
+from hypergrammar.productions.rewrite import Rewrite
+from hypergrammar.rfc import RFC
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None  # type: ignore[assignment]
+
+PRODUCTIONS: dict[str, type[IProd]] = {
+    "prod0": Prod0,
+    "prod9": Prod9,
+    "prod10": Prod10,
+}
+
+
+class CountingRFC:
+    """Wraps an RFC and counts its evaluations."""
+
+    def __init__(self, rfc: RFC) -> None:
+        self._rfc = rfc
+        self._lock = threading.Lock()
+        self.evaluations = 0
+
+    def is_valid(
+        self,
+        edge: Edge,
+        hypergraph: Hypergraph,
+        meta: Optional[Mapping[str, Any]] = None,
+    ) -> bool:
+        with self._lock:
+            self.evaluations += 1
+        return self._rfc.is_valid(edge, hypergraph, meta)
+
+
+class TimedProduction(IProd):
+    """Wraps a production and accumulates the time spent in it."""
+
+    def __init__(self, name: str, production: IProd) -> None:
+        self.name = name
+        self._production = production
+        self._lock = threading.Lock()
+        self.seconds = 0.0
+        self.applied = 0
+
+    def _timed(self, start: float) -> None:
+        with self._lock:
+            self.seconds += time.perf_counter() - start
+
+    def apply(self, graph: Hypergraph) -> Hypergraph | None:
+        start = time.perf_counter()
+        try:
+            result = self._production.apply(graph)
+        finally:
+            self._timed(start)
+        if result is not None:
+            self.applied += 1
+        return result
+
+    def candidates(self, graph: Hypergraph) -> list[Edge]:
+        start = time.perf_counter()
+        try:
+            return self._production.candidates(graph)
+        finally:
+            self._timed(start)
+
+    def rewrite(self, graph: Hypergraph, candidate: Edge) -> Optional[Rewrite]:
+        start = time.perf_counter()
+        try:
+            return self._production.rewrite(graph, candidate)
+        finally:
+            self._timed(start)
+
+
+def load_rfc(spec: str) -> RFC:
+    """Load an RFC from "module:attribute"; classes are instantiated."""
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"RFC must be given as 'module:attribute', got {spec!r}")
+    try:
+        rfc = getattr(importlib.import_module(module_name), attribute)
+    except ImportError as e:
+        raise ValueError(f"Cannot import RFC module {module_name!r}: {e}") from e
+    except AttributeError as e:
+        raise ValueError(f"Module {module_name!r} has no RFC {attribute!r}") from e
+    if isinstance(rfc, type):
+        rfc = rfc()
+    if not hasattr(rfc, "is_valid"):
+        raise ValueError(f"{spec} does not implement the RFC protocol")
+    return rfc  # type: ignore[no-any-return]
+
+
+def _peak_memory_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="hypergrammar",
+        description="Apply a production sequence to a mesh file until nothing changes.",
+    )
+    parser.add_argument("input", help="mesh JSON file to refine")
+    parser.add_argument("output", help="where to write the refined mesh JSON")
+    parser.add_argument(
+        "-p",
+        "--productions",
+        default="prod9,prod10",
+        help=f"comma separated production sequence from {', '.join(PRODUCTIONS)}",
+    )
+    parser.add_argument("--rfc", help="refinement criterion as 'module:attribute'")
+    parser.add_argument(
+        "-n",
+        "--steps",
+        type=int,
+        help="stop after N steps (production applications, or rounds with --workers)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help=(
+            "match independent sites on this many threads; matching is pure "
+            "Python, so the GIL lets threads overlap but not speed it up"
+        ),
+    )
+    parser.add_argument(
+        "--progress-every",
+        type=int,
+        default=1000,
+        help="print a progress line every N rewrites (0 disables)",
+    )
+    parser.add_argument("--report", help="also write the final report as JSON here")
+    return parser.parse_args(argv)
+
+
+def _productions(spec: str) -> list[TimedProduction]:
+    productions = []
+    for name in (n.strip() for n in spec.split(",")):
+        if name not in PRODUCTIONS:
+            raise ValueError(f"Unknown production {name!r}, choose from {', '.join(PRODUCTIONS)}")
+        productions.append(TimedProduction(name, PRODUCTIONS[name]()))
+    return productions
+
+
+def run(args: argparse.Namespace, out: TextIO) -> dict[str, Any]:
+    graph = load_mesh(args.input)
+    productions = _productions(args.productions)
+    rfc = CountingRFC(load_rfc(args.rfc)) if args.rfc else None
+    graph.set_rfc(rfc)
+
+    rewrites = 0
+    start = time.perf_counter()
+
+    def on_delta(_: GraphDelta) -> None:
+        nonlocal rewrites
+        rewrites += 1
+        if args.progress_every and rewrites % args.progress_every == 0:
+            elapsed = time.perf_counter() - start
+            marked = graph.get_stats().count(EdgeType.Q, "R", 1)
+            print(
+                f"{rewrites} rewrites, {rewrites / elapsed:.1f}/s, {marked} marked Q",
+                file=out,
+            )
+
+    graph.subscribe(on_delta)
+
+    steps = 0
+    if args.workers:
+        rewriter = ConcurrentRewriter(productions, max_workers=args.workers)
+        rewriter.run(graph, max_rounds=args.steps)
+        steps = rewriter.rounds
+        for production, applied in zip(productions, rewriter.applied):
+            production.applied = applied
+    else:
+        while args.steps is None or steps < args.steps:
+            if not any(p.apply(graph) is not None for p in productions):
+                break
+            steps += 1
+
+    elapsed = time.perf_counter() - start
+    save_mesh(graph, args.output)
+
+    return {
+        "rewrites": rewrites,
+        "steps": steps,
+        "seconds": elapsed,
+        "rewrites_per_second": rewrites / elapsed if elapsed else 0.0,
+        "rfc_evaluations": rfc.evaluations if rfc is not None else None,
+        "peak_memory_mb": _peak_memory_mb(),
+        "productions": {
+            p.name: {"applied": p.applied, "seconds": p.seconds} for p in productions
+        },
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    try:
+        report = run(args, sys.stderr)
+    except (OSError, ValueError) as e:
+        print(f"hypergrammar: error: {e}", file=sys.stderr)
+        return 1
+
+    print(
+        f"{report['rewrites']} rewrites in {report['seconds']:.3f}s "
+        f"({report['rewrites_per_second']:.1f}/s), {report['steps']} steps",
+        file=sys.stderr,
+    )
+    if report["rfc_evaluations"] is not None:
+        print(f"RFC evaluations: {report['rfc_evaluations']}", file=sys.stderr)
+    if report["peak_memory_mb"] is not None:
+        print(f"peak memory: {report['peak_memory_mb']:.1f} MB", file=sys.stderr)
+    for name, stats in report["productions"].items():
+        print(f"{name}: {stats['applied']} applied, {stats['seconds']:.3f}s", file=sys.stderr)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+    return 0
@@ -0,0 +1,55 @@
+from dataclasses import dataclass, field
+from typing import Callable, Mapping
+
+from hypergrammar.edge import Edge
+
+
+@dataclass(frozen=True)
+class GraphDelta:
+    """Net change of a `Hypergraph` over one mutation or one batch.
+
+    Changes that cancel out inside a batch (an edge added and removed
+    again) are not reported. `vertex_parameters` maps each touched vertex
+    to its final parameters.
+    """
+
+    added: frozenset[Edge] = frozenset()
+    removed: frozenset[Edge] = frozenset()
+    vertex_parameters: Mapping[str, dict[str, int]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.vertex_parameters)
+
+
+Observer = Callable[[GraphDelta], None]
+
+
+class DeltaBuilder:
+    """Accumulates mutations into a compact `GraphDelta`."""
+
+    def __init__(self) -> None:
+        self._added: dict[Edge, None] = {}
+        self._removed: dict[Edge, None] = {}
+        self._vertex_parameters: dict[str, dict[str, int]] = {}
+
+    def edge_added(self, edge: Edge) -> None:
+        if edge in self._removed:
+            del self._removed[edge]
+        else:
+            self._added[edge] = None
+
+    def edge_removed(self, edge: Edge) -> None:
+        if edge in self._added:
+            del self._added[edge]
+        else:
+            self._removed[edge] = None
+
+    def vertex_parameter_set(self, vertex: str, parameters: dict[str, int]) -> None:
+        self._vertex_parameters[vertex] = parameters
+
+    def build(self) -> GraphDelta:
+        return GraphDelta(
+            added=frozenset(self._added),
+            removed=frozenset(self._removed),
+            vertex_parameters=dict(self._vertex_parameters),
+        )
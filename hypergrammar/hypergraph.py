@@ -1,29 +1,197 @@
-from typing import Optional, Mapping, Any
+from contextlib import contextmanager
+from typing import Optional, Mapping, Any, Callable, Iterable, Iterator
 
-import xgi
-
-from hypergrammar.edge import Edge
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.events import DeltaBuilder, Observer
 from hypergrammar.rfc import RFC
+from hypergrammar.stats import GraphStats, StatsTracker
 from hypergrammar.utils import get_edge_color
 
 
+def _discard(index: dict[Any, set[Edge]], key: Any, edge: Edge) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.discard(edge)
+    if not bucket:
+        del index[key]
+
+
 class Hypergraph:
-    def __init__(self, rfc: Optional[RFC] = None) -> None:
+    def __init__(self, rfc: Optional[RFC] = None, strict_e_edges: bool = False) -> None:
         """Create a Hypergraph.
-        Optionally pass an `rfc` implementing `RFC` protocol
+        Optionally pass an `rfc` implementing `RFC` protocol.
+        With `strict_e_edges` adding a second E edge between the same two
+        vertices raises ValueError.
         """
-        self._edges: frozenset[Edge] = frozenset()
+        self._edges: set[Edge] = set()
+        # frozen copy handed out by get_edges, rebuilt lazily after mutations
+        self._edges_snapshot: Optional[frozenset[Edge]] = frozenset()
+        # bumped on every edge mutation, lets callers tell if cached results are stale
+        self._version = 0
         self._node_parameters: dict[str, dict[str, int]] = {}
+        self._incidence: dict[str, set[Edge]] = {}
+        self._type_index: dict[EdgeType, set[Edge]] = {}
+        self._parameter_index: dict[tuple[str, int], set[Edge]] = {}
+        self._e_pairs: dict[frozenset[str], set[Edge]] = {}
+        self._strict_e_edges = strict_e_edges
+        self._stats = StatsTracker()
         self._rfc: Optional[RFC] = rfc
+        self._observers: list[Observer] = []
+        self._delta: Optional[DeltaBuilder] = None
+        self._batch_depth = 0
+
+    def subscribe(self, observer: Observer) -> Callable[[], None]:
+        """Call `observer` with a `GraphDelta` after every change.
+
+        Mutations made inside `batch` are reported as one delta when the
+        outermost batch ends. Returns a function that unsubscribes.
+        """
+        self._observers.append(observer)
+        return lambda: self.unsubscribe(observer)
+
+    def unsubscribe(self, observer: Observer) -> None:
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group mutations so observers get a single delta for all of them."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
+
+    def _record(self) -> Optional[DeltaBuilder]:
+        if not self._observers:
+            return None
+        if self._delta is None:
+            self._delta = DeltaBuilder()
+        return self._delta
+
+    def _flush(self) -> None:
+        if self._batch_depth or self._delta is None:
+            return
+        delta = self._delta.build()
+        self._delta = None
+        if delta.is_empty():
+            return
+        for observer in list(self._observers):
+            observer(delta)
 
     def add_edge(self, edge: Edge) -> None:
-        self._edges = self._edges.union(frozenset([edge]))
+        if edge in self._edges:
+            return
+        is_e_pair = edge.get_type() == EdgeType.E and len(edge.get_vertices()) == 2
+        if is_e_pair and self._strict_e_edges and edge.get_vertices() in self._e_pairs:
+            (existing, *_) = self._e_pairs[edge.get_vertices()]
+            raise ValueError(f"{edge} duplicates {existing}")
+        self._edges.add(edge)
+        self._edges_snapshot = None
+        self._version += 1
+        for vertex in edge.get_vertices():
+            self._incidence.setdefault(vertex, set()).add(edge)
+        self._type_index.setdefault(edge.get_type(), set()).add(edge)
+        for item in edge.get_parameters().items():
+            self._parameter_index.setdefault(item, set()).add(edge)
+        if is_e_pair:
+            self._e_pairs.setdefault(edge.get_vertices(), set()).add(edge)
+        self._stats.edge_added(edge, self._position)
+
+        recorder = self._record()
+        if recorder is not None:
+            recorder.edge_added(edge)
+            self._flush()
 
     def remove_edge(self, edge: Edge) -> None:
-        self._edges = self._edges.difference(frozenset([edge]))
+        if edge not in self._edges:
+            return
+        self._edges.discard(edge)
+        self._edges_snapshot = None
+        self._version += 1
+        for vertex in edge.get_vertices():
+            _discard(self._incidence, vertex, edge)
+        _discard(self._type_index, edge.get_type(), edge)
+        for item in edge.get_parameters().items():
+            _discard(self._parameter_index, item, edge)
+        if edge.get_type() == EdgeType.E:
+            _discard(self._e_pairs, edge.get_vertices(), edge)
+        self._stats.edge_removed(edge)
+
+        recorder = self._record()
+        if recorder is not None:
+            recorder.edge_removed(edge)
+            self._flush()
+
+    def select_edges(
+        self,
+        edge_type: Optional[EdgeType] = None,
+        predicate: Optional[Callable[[Edge], bool]] = None,
+        **parameters: int,
+    ) -> frozenset[Edge]:
+        """Return edges of `edge_type` whose parameters equal `parameters`.
+
+        Type and parameter filters are answered from indexes, `predicate` is
+        only evaluated on what they leave, e.g.
+        `select_edges(EdgeType.E, R=1)`.
+        """
+        pools: list[set[Edge]] = []
+        if edge_type is not None:
+            pools.append(self._type_index.get(edge_type, set()))
+        for item in parameters.items():
+            pools.append(self._parameter_index.get(item, set()))
+
+        if pools:
+            pools.sort(key=len)
+            selected = set(pools[0]).intersection(*pools[1:])
+        else:
+            selected = set(self._edges)
+
+        if predicate is not None:
+            selected = {edge for edge in selected if predicate(edge)}
+        return frozenset(selected)
+
+    def update_parameters(
+        self, edges: Iterable[Edge], updates: Mapping[str, Optional[int]]
+    ) -> list[Edge]:
+        """Apply `updates` to the parameters of every edge in `edges`.
+
+        A None value removes the parameter. Edges are hashed by their
+        parameters, so each one is replaced by an updated copy; the whole
+        selection is reported to observers as one delta. Returns the
+        updated edges.
+        """
+        updated = []
+        with self.batch():
+            for edge in edges:
+                if edge not in self._edges:
+                    continue
+                parameters = dict(edge.get_parameters())
+                for key, value in updates.items():
+                    if value is None:
+                        parameters.pop(key, None)
+                    else:
+                        parameters[key] = value
+                new_edge = Edge(edge.get_type(), edge.get_vertices(), parameters)
+                if new_edge != edge:
+                    self.remove_edge(edge)
+                    self.add_edge(new_edge)
+                updated.append(new_edge)
+        return updated
 
     def set_vertex_parameter(self, vertex: str, parameter: dict[str, int]) -> None:
+        previous = self._position(vertex)
         self._node_parameters[vertex] = parameter
+        if self._position(vertex) != previous:
+            self._stats.vertex_moved(self._incidence.get(vertex, ()), self._position)
+
+        recorder = self._record()
+        if recorder is not None:
+            recorder.vertex_parameter_set(vertex, parameter)
+            self._flush()
 
     def set_rfc(self, rfc: Optional[RFC]) -> None:
         self._rfc = rfc
@@ -42,12 +210,50 @@ class Hypergraph:
         return bool(self._rfc.is_valid(edge, self, meta))
 
     def get_edges(self) -> frozenset[Edge]:
-        return self._edges
+        if self._edges_snapshot is None:
+            self._edges_snapshot = frozenset(self._edges)
+        return self._edges_snapshot
+
+    def get_version(self) -> int:
+        """Counter that changes whenever an edge is added or removed."""
+        return self._version
+
+    def has_edge(self, edge: Edge) -> bool:
+        return edge in self._edges
+
+    def get_vertices(self) -> frozenset[str]:
+        """Return vertices used by edges or carrying parameters."""
+        return frozenset(self._incidence).union(self._node_parameters)
+
+    def get_incident_edges(self, vertex: str) -> frozenset[Edge]:
+        """Return all edges containing `vertex` without scanning the graph."""
+        return frozenset(self._incidence.get(vertex, ()))
+
+    def get_e_edges(self, v1: str, v2: str) -> frozenset[Edge]:
+        """Return the E edges joining `v1` and `v2` from the pair index."""
+        return frozenset(self._e_pairs.get(frozenset([v1, v2]), ()))
 
     def get_vertex_parameters(self, vertex: str) -> dict[str, int]:
         return self._node_parameters.get(vertex, {})
 
+    def _position(self, vertex: str) -> Optional[tuple[float, float]]:
+        parameters = self._node_parameters.get(vertex, {})
+        if "x" not in parameters or "y" not in parameters:
+            return None
+        return parameters["x"], parameters["y"]
+
+    def get_stats(self) -> GraphStats:
+        """Edge counts per type, parameter value and colour plus element areas.
+
+        The aggregates are updated on every mutation, so this does not walk
+        the graph. Areas only cover Q elements whose vertices have "x"/"y".
+        """
+        return self._stats.snapshot()
+
     def draw(self, use_positional_parameters: bool = False) -> None:
+        # xgi pulls in networkx and matplotlib, load it only when drawing
+        import xgi  # pylint: disable=import-outside-toplevel
+
         xgi_h = xgi.Hypergraph()
 
         edges_to_draw: list[frozenset[str]] = []
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+def _edge_key(edge: Edge) -> tuple[Any, ...]:
+    return (
+        edge.get_type().value,
+        tuple(sorted(edge.get_vertices())),
+        tuple(sorted(edge.get_parameters().items())),
+    )
+
+
+def _parameter_columns(
+    rows: list[dict[str, int]],
+) -> tuple[dict[str, npt.NDArray[Any]], dict[str, npt.NDArray[Any]]]:
+    """Value and presence columns per parameter name; absent values are 0."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    keys = sorted({key for parameters in rows for key in parameters})
+    values = {
+        key: np.fromiter(
+            (parameters.get(key, 0) for parameters in rows),
+            dtype=np.int64,
+            count=len(rows),
+        )
+        for key in keys
+    }
+    masks = {
+        key: np.fromiter(
+            (key in parameters for parameters in rows), dtype=bool, count=len(rows)
+        )
+        for key in keys
+    }
+    return values, masks
+
+
+def _masks(
+    columns: dict[str, npt.NDArray[Any]],
+    masks: Optional[dict[str, npt.ArrayLike]],
+) -> dict[str, npt.NDArray[Any]]:
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    masks = masks or {}
+    return {
+        key: (
+            np.asarray(masks[key], dtype=bool)
+            if key in masks
+            else np.ones(len(column), dtype=bool)
+        )
+        for key, column in columns.items()
+    }
+
+
+def _row_parameters(
+    columns: dict[str, npt.NDArray[Any]], masks: dict[str, npt.NDArray[Any]], i: int
+) -> dict[str, int]:
+    return {key: int(column[i]) for key, column in columns.items() if masks[key][i]}
+
+
+@dataclass(frozen=True)
+class IncidenceArrays:
+    """Vertex-hyperedge incidence of a graph in COO form.
+
+    Vertices are numbered in sorted name order and edges by type, vertices
+    and parameters, so the numbering is stable across runs. `rows[i]` is
+    the vertex and `cols[i]` the edge of the i-th incidence entry. Every
+    parameter column has a boolean mask of the same length telling whether
+    the edge or vertex has the parameter at all; absent values read as 0.
+
+    Needs NumPy, and SciPy for the sparse matrix helpers; both are imported
+    on first use so the core package stays stdlib-only.
+    """
+
+    vertices: list[str]
+    edges: list[Edge]
+    rows: npt.NDArray[Any]
+    cols: npt.NDArray[Any]
+    edge_types: npt.NDArray[Any]
+    edge_parameters: dict[str, npt.NDArray[Any]]
+    vertex_parameters: dict[str, npt.NDArray[Any]]
+    edge_parameter_masks: dict[str, npt.NDArray[Any]]
+    vertex_parameter_masks: dict[str, npt.NDArray[Any]]
+
+    @classmethod
+    def from_hypergraph(cls, graph: Hypergraph) -> IncidenceArrays:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        vertices = sorted(graph.get_vertices())
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        edges = sorted(graph.get_edges(), key=_edge_key)
+
+        sizes = np.fromiter(
+            (len(edge.get_vertices()) for edge in edges), dtype=np.int64, count=len(edges)
+        )
+        rows = np.fromiter(
+            (index[v] for edge in edges for v in sorted(edge.get_vertices())),
+            dtype=np.int64,
+            count=int(sizes.sum()),
+        )
+        cols = np.repeat(np.arange(len(edges), dtype=np.int64), sizes)
+        edge_types = np.fromiter(
+            (edge.get_type().value for edge in edges), dtype=np.int8, count=len(edges)
+        )
+
+        edge_parameters, edge_masks = _parameter_columns(
+            [edge.get_parameters() for edge in edges]
+        )
+        vertex_parameters, vertex_masks = _parameter_columns(
+            [graph.get_vertex_parameters(vertex) for vertex in vertices]
+        )
+        return cls(
+            vertices=vertices,
+            edges=edges,
+            rows=rows,
+            cols=cols,
+            edge_types=edge_types,
+            edge_parameters=edge_parameters,
+            vertex_parameters=vertex_parameters,
+            edge_parameter_masks=edge_masks,
+            vertex_parameter_masks=vertex_masks,
+        )
+
+    @classmethod
+    def from_sparse(
+        cls,
+        matrix: Any,
+        vertices: list[str],
+        edge_types: npt.ArrayLike,
+        edge_parameters: Optional[dict[str, npt.ArrayLike]] = None,
+        vertex_parameters: Optional[dict[str, npt.ArrayLike]] = None,
+        edge_parameter_masks: Optional[dict[str, npt.ArrayLike]] = None,
+        vertex_parameter_masks: Optional[dict[str, npt.ArrayLike]] = None,
+    ) -> IncidenceArrays:
+        """Rebuild the arrays from a SciPy incidence matrix and its columns.
+
+        A parameter column without a mask is taken to be set everywhere.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        coo = matrix.tocoo()
+        order = np.lexsort((coo.row, coo.col))
+        rows = np.asarray(coo.row[order], dtype=np.int64)
+        cols = np.asarray(coo.col[order], dtype=np.int64)
+        types = np.asarray(edge_types, dtype=np.int8)
+        edge_columns = {
+            key: np.asarray(values, dtype=np.int64)
+            for key, values in (edge_parameters or {}).items()
+        }
+        vertex_columns = {
+            key: np.asarray(values, dtype=np.int64)
+            for key, values in (vertex_parameters or {}).items()
+        }
+        edge_masks = _masks(edge_columns, edge_parameter_masks)
+        vertex_masks = _masks(vertex_columns, vertex_parameter_masks)
+
+        bounds = np.searchsorted(cols, np.arange(len(types) + 1))
+        edges = []
+        for j, edge_type in enumerate(types.tolist()):
+            members = rows[bounds[j] : bounds[j + 1]].tolist()
+            edges.append(
+                Edge(
+                    EdgeType(edge_type),
+                    frozenset(vertices[i] for i in members),
+                    _row_parameters(edge_columns, edge_masks, j),
+                )
+            )
+
+        return cls(
+            vertices=list(vertices),
+            edges=edges,
+            rows=rows,
+            cols=cols,
+            edge_types=types,
+            edge_parameters=edge_columns,
+            vertex_parameters=vertex_columns,
+            edge_parameter_masks=edge_masks,
+            vertex_parameter_masks=vertex_masks,
+        )
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self.vertices), len(self.edges)
+
+    def to_coo(self) -> Any:
+        """Incidence matrix (vertices x edges) as `scipy.sparse.coo_matrix`."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        from scipy import sparse  # pylint: disable=import-outside-toplevel
+
+        data = np.ones(len(self.rows), dtype=np.int8)
+        return sparse.coo_matrix((data, (self.rows, self.cols)), shape=self.shape)
+
+    def to_csr(self) -> Any:
+        """Incidence matrix (vertices x edges) as `scipy.sparse.csr_matrix`."""
+        return self.to_coo().tocsr()
+
+    def e_adjacency(self) -> Any:
+        """Symmetric vertex adjacency through E edges as `scipy.sparse.csr_matrix`."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        from scipy import sparse  # pylint: disable=import-outside-toplevel
+
+        counts = np.bincount(self.cols, minlength=len(self.edges))
+        is_pair = (self.edge_types == EdgeType.E.value) & (counts == 2)
+        pairs = self.rows[is_pair[self.cols]].reshape(-1, 2)
+        row = np.concatenate([pairs[:, 0], pairs[:, 1]])
+        col = np.concatenate([pairs[:, 1], pairs[:, 0]])
+        data = np.ones(len(row), dtype=np.int8)
+        size = len(self.vertices)
+        return sparse.coo_matrix((data, (row, col)), shape=(size, size)).tocsr()
+
+    def to_hypergraph(self) -> Hypergraph:
+        graph = Hypergraph()
+        with graph.batch():
+            for edge in self.edges:
+                graph.add_edge(edge)
+            for i, vertex in enumerate(self.vertices):
+                parameters = _row_parameters(
+                    self.vertex_parameters, self.vertex_parameter_masks, i
+                )
+                if parameters:
+                    graph.set_vertex_parameter(vertex, parameters)
+        return graph
@@ -0,0 +1,106 @@
+from dataclasses import dataclass, field
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.signature import boundary_cycle
+
+
+@dataclass(frozen=True)
+class IntegrityReport:
+    """Problems found by `check_integrity`.
+
+    `duplicate_e_edges` maps a vertex pair to every E edge joining it when
+    there is more than one, `malformed_e_edges` holds E edges that do not
+    join exactly two vertices, `open_elements` the Q edges whose vertices
+    are not closed by E edges and `dangling_vertices` the vertices that
+    carry parameters but belong to no edge.
+    """
+
+    duplicate_e_edges: dict[frozenset[str], frozenset[Edge]] = field(default_factory=dict)
+    malformed_e_edges: frozenset[Edge] = frozenset()
+    open_elements: frozenset[Edge] = frozenset()
+    dangling_vertices: frozenset[str] = frozenset()
+
+    def is_valid(self) -> bool:
+        return not (
+            self.duplicate_e_edges
+            or self.malformed_e_edges
+            or self.open_elements
+            or self.dangling_vertices
+        )
+
+    def summary(self, limit: int = 5) -> str:
+        """One line per kind of problem with its count and up to `limit` examples."""
+        findings: list[tuple[str, list[str]]] = [
+            (
+                "duplicate E edge pairs",
+                sorted("-".join(sorted(pair)) for pair in self.duplicate_e_edges),
+            ),
+            ("malformed E edges", sorted(str(e) for e in self.malformed_e_edges)),
+            ("open elements", sorted(str(e) for e in self.open_elements)),
+            ("dangling vertices", sorted(self.dangling_vertices)),
+        ]
+        lines = []
+        for name, items in findings:
+            if not items:
+                continue
+            more = f", ... ({len(items) - limit} more)" if len(items) > limit else ""
+            lines.append(f"{len(items)} {name}: {', '.join(items[:limit])}{more}")
+        return "\n".join(lines) if lines else "ok"
+
+
+def _group_e_edges(graph: Hypergraph) -> tuple[dict[frozenset[str], set[Edge]], set[Edge]]:
+    pairs: dict[frozenset[str], set[Edge]] = {}
+    malformed = set()
+    for edge in graph.select_edges(EdgeType.E):
+        if len(edge.get_vertices()) != 2:
+            malformed.add(edge)
+        else:
+            pairs.setdefault(edge.get_vertices(), set()).add(edge)
+    return pairs, malformed
+
+
+def check_integrity(graph: Hypergraph) -> IntegrityReport:
+    """Validate `graph` in one pass over its edges and vertices.
+
+    Boundary walks are local to each element, so the whole check is linear
+    in the size of the mesh.
+    """
+    pairs, malformed = _group_e_edges(graph)
+    return IntegrityReport(
+        duplicate_e_edges={
+            pair: frozenset(edges) for pair, edges in pairs.items() if len(edges) > 1
+        },
+        malformed_e_edges=frozenset(malformed),
+        open_elements=frozenset(
+            q
+            for q in graph.select_edges(EdgeType.Q)
+            if boundary_cycle(graph, q.get_vertices()) is None
+        ),
+        dangling_vertices=frozenset(
+            v for v in graph.get_vertices() if not graph.get_incident_edges(v)
+        ),
+    )
+
+
+def deduplicate_e_edges(graph: Hypergraph) -> list[Edge]:
+    """Merge every group of E edges joining the same two vertices into one.
+
+    The merged edge takes the largest value of each parameter, so an edge
+    marked for refinement in any copy stays marked. Returns the merged edges.
+    """
+    merged = []
+    with graph.batch():
+        for pair, edges in _group_e_edges(graph)[0].items():
+            if len(edges) < 2:
+                continue
+            parameters: dict[str, int] = {}
+            for edge in edges:
+                for key, value in edge.get_parameters().items():
+                    parameters[key] = max(value, parameters.get(key, value))
+            for edge in edges:
+                graph.remove_edge(edge)
+            new_edge = Edge(EdgeType.E, pair, parameters)
+            graph.add_edge(new_edge)
+            merged.append(new_edge)
+    return merged
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import itertools
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Sequence
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+@lru_cache(maxsize=None)
+def cycle_templates(size: int) -> npt.NDArray[Any]:
+    """Every distinct cyclic ordering of `size` positions as rows.
+
+    Orderings are fixed to start at position 0 and taken in one direction
+    only, which leaves (size - 1)! / 2 rows (3 for quads, 60 for hexagons).
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    rows = [
+        (0, *perm)
+        for perm in itertools.permutations(range(1, size))
+        if size < 3 or perm[0] < perm[-1]
+    ]
+    return np.array(rows, dtype=np.int64).reshape(len(rows), size)
+
+
+def pack_pairs(a: npt.ArrayLike, b: npt.ArrayLike) -> npt.NDArray[Any]:
+    """Pack unordered vertex id pairs into one uint64 key each."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    a = np.asarray(a, dtype=np.uint64)
+    b = np.asarray(b, dtype=np.uint64)
+    keys: npt.NDArray[Any] = (np.minimum(a, b) << np.uint64(32)) | np.maximum(a, b)
+    return keys
+
+
+class EdgeKeyIndex:
+    """Integer-keyed snapshot of a graph's E edges for batch validation.
+
+    Vertices get dense ids, every E edge becomes a packed 64-bit pair key
+    and the keys are kept in a sorted NumPy array, so membership of many
+    pairs at once is a single `searchsorted`. The index does not follow
+    later changes to the graph; rebuild it after mutating.
+    """
+
+    def __init__(self, graph: Hypergraph) -> None:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        self.vertex_ids = {v: i for i, v in enumerate(sorted(graph.get_vertices()))}
+        e_pairs = [
+            tuple(self.vertex_ids[v] for v in edge.get_vertices())
+            for edge in graph.select_edges(EdgeType.E)
+            if len(edge.get_vertices()) == 2
+        ]
+        pairs = np.array(e_pairs, dtype=np.int64).reshape(-1, 2)
+        self.keys = np.unique(pack_pairs(pairs[:, 0], pairs[:, 1]))
+
+    def has_pairs(self, a: npt.ArrayLike, b: npt.ArrayLike) -> npt.NDArray[Any]:
+        """Element-wise: is there an E edge between vertex ids `a` and `b`?"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        keys = pack_pairs(a, b)
+        if not len(self.keys):
+            return np.zeros(keys.shape, dtype=bool)
+        positions = np.searchsorted(self.keys, keys)
+        positions = np.minimum(positions, len(self.keys) - 1)
+        return self.keys[positions] == keys  # type: ignore[no-any-return]
+
+    def validate_cycles(self, cycles: npt.ArrayLike) -> npt.NDArray[Any]:
+        """For each row of vertex ids, is it a closed cycle of E edges?"""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        cycles = np.asarray(cycles, dtype=np.int64)
+        following = np.roll(cycles, -1, axis=-1)
+        closed: npt.NDArray[Any] = np.all(self.has_pairs(cycles, following), axis=-1)
+        return closed
+
+    def closed_boundaries(self, elements: Sequence[Edge]) -> npt.NDArray[Any]:
+        """For each element, do its vertices form a closed E cycle in any order?
+
+        Elements are grouped by size and every cyclic ordering of every
+        element in a group is checked in one vectorized pass.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        result = np.zeros(len(elements), dtype=bool)
+        by_size: dict[int, list[int]] = {}
+        for i, element in enumerate(elements):
+            by_size.setdefault(len(element.get_vertices()), []).append(i)
+
+        for size, indexes in by_size.items():
+            if size < 3:
+                continue
+            ids = np.array(
+                [
+                    sorted(self.vertex_ids.get(v, -1) for v in elements[i].get_vertices())
+                    for i in indexes
+                ],
+                dtype=np.int64,
+            )
+            known = (ids >= 0).all(axis=1)
+            # (elements, orderings, size) vertex ids for every candidate cycle
+            candidates = ids[:, cycle_templates(size)]
+            closed = self.validate_cycles(candidates).any(axis=1) & known
+            result[np.array(indexes)] = closed
+        return result
+
+
+def closed_elements(graph: Hypergraph, elements: Sequence[Edge]) -> frozenset[Edge]:
+    """The `elements` whose boundary is closed by E edges, in one batch."""
+    closed = EdgeKeyIndex(graph).closed_boundaries(elements)
+    return frozenset(e for e, ok in zip(elements, closed.tolist()) if ok)
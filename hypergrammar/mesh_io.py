@@ -0,0 +1,95 @@
+import json
+import os
+from typing import Any
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+
+
+def mesh_to_dict(graph: Hypergraph) -> dict[str, Any]:
+    """Plain JSON-compatible form of `graph`.
+
+    {"vertices": {name: parameters}, "edges": [{"type", "vertices", "parameters"}]}
+    Only vertices with parameters are listed under "vertices".
+    """
+    vertices = {}
+    for vertex in sorted(graph.get_vertices()):
+        parameters = graph.get_vertex_parameters(vertex)
+        if parameters:
+            vertices[vertex] = parameters
+
+    edges = [
+        {
+            "type": edge.get_type().name,
+            "vertices": sorted(edge.get_vertices()),
+            "parameters": edge.get_parameters(),
+        }
+        for edge in sorted(
+            graph.get_edges(),
+            key=lambda e: (
+                e.get_type().name,
+                sorted(e.get_vertices()),
+                sorted(e.get_parameters().items()),
+            ),
+        )
+    ]
+    return {"vertices": vertices, "edges": edges}
+
+
+def _parameters(value: Any, owner: str) -> dict[str, int]:
+    if not isinstance(value, dict):
+        raise ValueError(f"Parameters of {owner} must be an object, got {value!r}")
+    for key, parameter in value.items():
+        # bool is an int subclass but would not round-trip as a number
+        if not isinstance(parameter, int) or isinstance(parameter, bool):
+            raise ValueError(
+                f"Parameter {key!r} of {owner} must be an integer, got {parameter!r}"
+            )
+    return dict(value)
+
+
+def _edge_from_dict(item: Any) -> Edge:
+    if not isinstance(item, dict):
+        raise ValueError(f"Mesh edge must be an object, got {item!r}")
+    edge_type = item.get("type")
+    if not isinstance(edge_type, str) or edge_type not in EdgeType.__members__:
+        raise ValueError(f"Unknown edge type in mesh: {edge_type!r}")
+    vertices = item.get("vertices")
+    if vertices is None:
+        raise ValueError(f"Mesh edge without vertices: {item!r}")
+    if not isinstance(vertices, list) or not all(isinstance(v, str) for v in vertices):
+        raise ValueError(f"Mesh edge vertices must be a list of names, got {vertices!r}")
+    return Edge(
+        EdgeType[edge_type],
+        frozenset(vertices),
+        _parameters(item.get("parameters", {}), f"edge {sorted(vertices)}"),
+    )
+
+
+def mesh_from_dict(data: dict[str, Any]) -> Hypergraph:
+    """Inverse of `mesh_to_dict`; malformed input raises ValueError."""
+    if not isinstance(data, dict):
+        raise ValueError("Mesh must be a JSON object with 'vertices' and 'edges'")
+    edges = data.get("edges", [])
+    if not isinstance(edges, list):
+        raise ValueError(f"Mesh 'edges' must be a list, got {edges!r}")
+    vertices = data.get("vertices", {})
+    if not isinstance(vertices, dict):
+        raise ValueError(f"Mesh 'vertices' must be an object, got {vertices!r}")
+
+    graph = Hypergraph()
+    for item in edges:
+        graph.add_edge(_edge_from_dict(item))
+    for vertex, parameters in vertices.items():
+        graph.set_vertex_parameter(vertex, _parameters(parameters, f"vertex {vertex!r}"))
+    return graph
+
+
+def load_mesh(path: str | os.PathLike[str]) -> Hypergraph:
+    with open(path, encoding="utf-8") as f:
+        return mesh_from_dict(json.load(f))
+
+
+def save_mesh(graph: Hypergraph, path: str | os.PathLike[str]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(mesh_to_dict(graph), f, indent=1)
@@ -0,0 +1,64 @@
+import random
+from typing import Optional
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+
+
+def _vertex(x: int, y: int) -> str:
+    return f"{x}_{y}"
+
+
+def _flags(rng: Optional[random.Random], keys: tuple[str, ...]) -> dict[str, int]:
+    if rng is None:
+        return {key: 0 for key in keys}
+    return {key: rng.randint(0, 1) for key in keys}
+
+
+def _add_ring(
+    graph: Hypergraph,
+    ring: list[tuple[int, int]],
+    rng: Optional[random.Random],
+    seen: set[frozenset[str]],
+) -> None:
+    names = [_vertex(x, y) for x, y in ring]
+    graph.add_edge(Edge(EdgeType.Q, frozenset(names), _flags(rng, ("R",))))
+    for i, name in enumerate(names):
+        pair = frozenset([name, names[(i + 1) % len(names)]])
+        if pair not in seen:
+            seen.add(pair)
+            graph.add_edge(Edge(EdgeType.E, pair, _flags(rng, ("R", "B"))))
+    for (x, y), name in zip(ring, names):
+        graph.set_vertex_parameter(name, {"x": x, "y": y})
+
+
+def quad_grid(nx: int, ny: int, rng: Optional[random.Random] = None) -> Hypergraph:
+    """Structured `nx` x `ny` mesh of quads with shared E edges.
+
+    Vertices are named "x_y" and carry integer "x"/"y" parameters. Without
+    `rng` every R/B flag is 0, with it each flag is drawn at random.
+    """
+    graph = Hypergraph()
+    seen: set[frozenset[str]] = set()
+    for x in range(nx):
+        for y in range(ny):
+            _add_ring(graph, [(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)], rng, seen)
+    return graph
+
+
+def hex_grid(nx: int, ny: int, rng: Optional[random.Random] = None) -> Hypergraph:
+    """Mesh of `nx` x `ny` hexagons laid out as an offset brick wall.
+
+    Every element is a topological hexagon (three vertices along its bottom,
+    three along its top); neighbours share one E edge. Naming and flags
+    follow `quad_grid`.
+    """
+    graph = Hypergraph()
+    seen: set[frozenset[str]] = set()
+    for y in range(ny):
+        offset = y % 2
+        for i in range(nx):
+            x = 2 * i + offset
+            ring = [(x, y), (x + 1, y), (x + 2, y), (x + 2, y + 1), (x + 1, y + 1), (x, y + 1)]
+            _add_ring(graph, ring, rng, seen)
+    return graph
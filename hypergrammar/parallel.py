@@ -0,0 +1,160 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Sequence
+
+from hypergrammar.edge import Edge
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.productions.i_prod import IProd
+from hypergrammar.productions.rewrite import Rewrite
+from hypergrammar.rfc import RFC
+from hypergrammar.shared import SharedHypergraph
+
+# chunks handed to each worker per round, balances load against task overhead
+_CHUNKS_PER_WORKER = 4
+
+
+def _match(
+    production: IProd, graph: Hypergraph, candidates: Sequence[Edge]
+) -> list[Optional[Rewrite]]:
+    return [production.rewrite(graph, candidate) for candidate in candidates]
+
+
+def _match_shared(
+    production: IProd, name: str, rfc: Optional[RFC], candidates: Sequence[Edge]
+) -> list[Optional[Rewrite]]:
+    """Match `candidates` in a worker process against an exported graph."""
+    with SharedHypergraph.attach(name, rfc) as view:
+        # productions only use the read API, which the view provides
+        return _match(production, view, candidates)  # type: ignore[arg-type]
+
+
+def _chunks(items: Sequence[Edge], count: int) -> list[Sequence[Edge]]:
+    size = max(1, -(-len(items) // max(count, 1)))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def claim_regions(rewrites: Sequence[Rewrite]) -> tuple[list[Rewrite], list[Rewrite]]:
+    """Split `rewrites` into a conflict-free batch and the deferred rest.
+
+    Rewrites claim their vertex regions in order; one whose region overlaps
+    an earlier claim is deferred and has to be re-matched on the updated
+    graph.
+    """
+    claimed: set[str] = set()
+    accepted: list[Rewrite] = []
+    deferred: list[Rewrite] = []
+    for rewrite in rewrites:
+        if claimed.isdisjoint(rewrite.region):
+            claimed.update(rewrite.region)
+            accepted.append(rewrite)
+        else:
+            deferred.append(rewrite)
+    return accepted, deferred
+
+
+class ConcurrentRewriter:
+    """Apply productions to a fixpoint, matching independent sites concurrently.
+
+    Every round matches all candidates of a production in parallel against
+    the unchanged graph, which is where RFC evaluation and boundary checks
+    spend their time. Matches then claim their vertex regions: the
+    non-overlapping ones are validated and committed, conflicting ones are
+    re-matched in the next round. Commits are serialized because
+    `Hypergraph` storage is not thread-safe; since committed regions are
+    disjoint their order does not matter.
+
+    Threads share the graph but hold the GIL while matching pure Python
+    productions. With `processes=True` or a `ProcessPoolExecutor` the graph
+    is exported to a `SharedHypergraph` once per round and workers match
+    against that view, so productions and the RFC must be picklable.
+
+    As long as the RFC only looks at the neighbourhood of the edge it
+    judges, the result equals applying each production sequentially until
+    it returns None.
+    """
+
+    def __init__(
+        self,
+        productions: Sequence[IProd],
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        processes: bool = False,
+    ) -> None:
+        self._productions = list(productions)
+        self._max_workers = max_workers
+        self._executor = executor
+        self._processes = processes
+        self.rounds = 0
+        self.conflicts = 0
+        # committed rewrites of the last run, aligned with `productions`
+        self.applied = [0] * len(self._productions)
+
+    def run(self, graph: Hypergraph, max_rounds: Optional[int] = None) -> int:
+        """Rewrite `graph` in place and return the number of applied rewrites."""
+        self.rounds = 0
+        self.conflicts = 0
+        self.applied = [0] * len(self._productions)
+        if self._executor is not None:
+            return self._run(graph, self._executor, max_rounds)
+        pool = ProcessPoolExecutor if self._processes else ThreadPoolExecutor
+        with pool(max_workers=self._max_workers) as executor:
+            return self._run(graph, executor, max_rounds)
+
+    def _run(
+        self, graph: Hypergraph, executor: Executor, max_rounds: Optional[int]
+    ) -> int:
+        def exhausted() -> bool:
+            return max_rounds is not None and self.rounds >= max_rounds
+
+        applied = 0
+        progress = True
+        while progress and not exhausted():
+            progress = False
+            for index, production in enumerate(self._productions):
+                while not exhausted():
+                    committed = self._round(graph, production, executor)
+                    if not committed:
+                        break
+                    self.applied[index] += committed
+                    applied += committed
+                    progress = True
+        return applied
+
+    def _round(self, graph: Hypergraph, production: IProd, executor: Executor) -> int:
+        self.rounds += 1
+        candidates = production.candidates(graph)
+        if not candidates:
+            return 0
+        workers = self._max_workers or os.cpu_count() or 1
+        chunks = _chunks(candidates, workers * _CHUNKS_PER_WORKER)
+        count = len(chunks)
+
+        if isinstance(executor, ProcessPoolExecutor):
+            shared = SharedHypergraph.export(graph)
+            try:
+                matches = list(
+                    executor.map(
+                        _match_shared,
+                        [production] * count,
+                        [shared.name] * count,
+                        [graph.get_rfc()] * count,
+                        chunks,
+                    )
+                )
+            finally:
+                shared.close()
+                shared.unlink()
+        else:
+            matches = list(executor.map(_match, [production] * count, [graph] * count, chunks))
+
+        rewrites = [rewrite for chunk in matches for rewrite in chunk if rewrite is not None]
+
+        accepted, deferred = claim_regions(rewrites)
+        self.conflicts += len(deferred)
+
+        committed = 0
+        for rewrite in accepted:
+            if rewrite.is_applicable(graph):
+                rewrite.commit(graph)
+                committed += 1
+        return committed
@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from hypergrammar.edge import Edge
 from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.productions.rewrite import Rewrite
 
 
 class IProd(ABC):
     @abstractmethod
     def apply(self, graph: Hypergraph) -> Hypergraph | None:
         pass
+
+    @abstractmethod
+    def candidates(self, graph: Hypergraph) -> list[Edge]:
+        """Edges that may anchor a match of this production."""
+
+    @abstractmethod
+    def rewrite(self, graph: Hypergraph, candidate: Edge) -> Optional[Rewrite]:
+        """Match the production at `candidate` without modifying `graph`."""
@@ -1,70 +1,94 @@
-import itertools
-from typing import Optional
+import weakref
+from typing import Any, Optional
 
 from hypergrammar.productions.i_prod import IProd
+from hypergrammar.productions.rewrite import Rewrite
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
-from hypergrammar.utils import canonical_rotation
+from hypergrammar.kernels import closed_elements
+from hypergrammar.signature import boundary_cycle
 from hypergrammar.rfc import RFC
 
 
 class Prod0(IProd):
 
-    def __init__(self, rfc: Optional[RFC] = None):
+    def __init__(self, rfc: Optional[RFC] = None, vectorized: bool = False):
         self._rfc = rfc
+        # check every candidate boundary in one NumPy batch when a rewriter
+        # asks for all `candidates` of a round; `apply` rewrites a single
+        # site, where the batch would cost more than the walks it saves
+        self._vectorized = vectorized
+        # (graph, graph version, closed candidates) of the last batch
+        self._closed: Optional[
+            tuple[weakref.ref[Hypergraph], int, frozenset[Edge]]
+        ] = None
         super().__init__()
 
-    def apply(self, graph: Hypergraph) -> Hypergraph | None:
-        hg_edges = graph.get_edges()
-
-        # Find evry Q edge with R=0
-        q_edges = []
-        for edge in hg_edges:
-            if edge.get_type() == EdgeType.Q and edge.get_parameters().get("R") == 0:
-                q_edges.append(edge)
-
-        if not q_edges:
-            return None
-
-        for q_edge in q_edges:
+    def __getstate__(self) -> dict[str, Any]:
+        # the batch only holds for the graph it was computed on
+        state = self.__dict__.copy()
+        state["_closed"] = None
+        return state
 
-            q_edge_vertices = q_edge.get_vertices()
-            if len(q_edge_vertices) != 4:
-                raise ValueError(
-                    f"Q edge must connect exactly 4 vertices, but got {len(q_edge_vertices)}"
-                )
-
-            unique_cycles = set()
-            for perm in itertools.permutations(q_edge_vertices):
-                unique_cycles.add(canonical_rotation(list(perm)))
+    def apply(self, graph: Hypergraph) -> Hypergraph | None:
+        for q_edge in self._q_edges(graph):
+            rewrite = self.rewrite(graph, q_edge)
+            if rewrite is None:
+                continue
 
-            cycle_matches = False
-            for unique_cycle in unique_cycles:
-                cycle_matches = self._check_cycle(graph, unique_cycle)
-                if cycle_matches:
-                    break
+            new_graph = graph
+            rewrite.commit(new_graph)
 
-            if not cycle_matches:
-                continue
+            return new_graph
 
-            # valid edge found -> check refinement criterion (rfc)
-            if not self._validate_edge(q_edge, graph):
-                continue
+        return None
 
-            new_q_edge = Edge(
-                edge_type=EdgeType.Q,
-                vertices=q_edge_vertices,
-                parameters={"R": 1},
+    def _q_edges(self, graph: Hypergraph) -> list[Edge]:
+        # Find evry Q edge with R=0
+        return list(graph.select_edges(EdgeType.Q, R=0))
+
+    def candidates(self, graph: Hypergraph) -> list[Edge]:
+        q_edges = self._q_edges(graph)
+        if not self._vectorized:
+            return q_edges
+
+        quads = [q for q in q_edges if len(q.get_vertices()) == 4]
+        closed = closed_elements(graph, quads)
+        self._closed = (weakref.ref(graph), graph.get_version(), closed)
+        return [q for q in q_edges if q in closed or len(q.get_vertices()) != 4]
+
+    def rewrite(self, graph: Hypergraph, candidate: Edge) -> Optional[Rewrite]:
+        q_edge = candidate
+        q_edge_vertices = q_edge.get_vertices()
+        if len(q_edge_vertices) != 4:
+            raise ValueError(
+                f"Q edge must connect exactly 4 vertices, but got {len(q_edge_vertices)}"
             )
 
-            new_graph = graph
+        if not self._is_closed(graph, q_edge):
+            return None
 
-            new_graph.remove_edge(q_edge)
-            new_graph.add_edge(new_q_edge)
+        # valid edge found -> check refinement criterion (rfc)
+        if not self._validate_edge(q_edge, graph):
+            return None
 
-            return new_graph
+        new_q_edge = Edge(
+            edge_type=EdgeType.Q,
+            vertices=q_edge_vertices,
+            parameters={"R": 1},
+        )
 
-        return None
+        return Rewrite(
+            region=q_edge_vertices,
+            remove=frozenset([q_edge]),
+            add=frozenset([new_q_edge]),
+        )
+
+    def _is_closed(self, graph: Hypergraph, q_edge: Edge) -> bool:
+        batch = self._closed
+        if batch is not None and batch[0]() is graph and batch[1] == graph.get_version():
+            return q_edge in batch[2]
+        return boundary_cycle(graph, q_edge.get_vertices()) is not None
 
     def _validate_edge(self, q_edge: Edge, graph: Hypergraph) -> bool:
         if self._rfc is not None:
@@ -79,7 +103,10 @@ class Prod0(IProd):
         return res
 
     def _e_edges_match(self, graph: Hypergraph, edges_vertices: frozenset[str]) -> bool:
-        for edge in graph.get_edges():
+        vertex = next(iter(edges_vertices), None)
+        if vertex is None:
+            return False
+        for edge in graph.get_incident_edges(vertex):
             if edge.get_type() == EdgeType.E and edge.get_vertices() == edges_vertices:
                 return True
         return False
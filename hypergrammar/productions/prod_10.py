@@ -1,73 +1,76 @@
-import itertools
+from typing import Optional
+
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.productions.i_prod import IProd
+from hypergrammar.productions.rewrite import Rewrite
+from hypergrammar.kernels import closed_elements
+from hypergrammar.signature import boundary_cycle, e_edges_between
 
-class Prod10:
+class Prod10(IProd):
     """
     P10: Propagacja oznaczenia refinacji z Q na krawędzie E.
     Wymaga pełnego dopasowania topologicznego (cykl krawędzi E).
     """
+
+    def __init__(self, vectorized: bool = False):
+        # Z `vectorized` kandydaci rundy (`candidates`) bez zamkniętego obwodu E
+        # są odrzucani jednym wsadowym sprawdzeniem NumPy; `apply` go pomija
+        self._vectorized = vectorized
     
     def apply(self, graph: Hypergraph) -> Hypergraph | None:
-        # 1. Znajdź "kotwicę": Q z R=1
-        q_edges = [
-            e for e in graph.get_edges()
-            if e.get_type() == EdgeType.Q and e.get_parameters().get("R") == 1
-        ]
-
-        for q_edge in q_edges:
-            vertices = list(q_edge.get_vertices())
-            if len(vertices) != 6:
+        for q_edge in self._q_edges(graph):
+            rewrite = self.rewrite(graph, q_edge)
+            if rewrite is None:
                 continue
 
-            # 2. Znajdź właściwą kolejność wierzchołków tworzącą cykl E
-            # Sprawdzamy permutacje, aby znaleźć taką, która układa się w krawędzie E
-            valid_cycle = None
+            # 5. Aplikacja zmian (Ustawienie R=1 dla krawędzi E)
+            rewrite.commit(graph)
+            return graph
 
-            for perm in itertools.permutations(vertices):
-                if self._check_cycle(graph, perm):
-                    valid_cycle = perm
-                    break
-            
-            if valid_cycle is None:
-                continue # Nie znaleziono pełnego obwodu E wokół tego Q
+        return None
 
-            # 3. Zbierz krawędzie z tego cyklu
-            boundary_edges = self._get_edges_from_cycle(graph, valid_cycle)
+    def _q_edges(self, graph: Hypergraph) -> list[Edge]:
+        # 1. Znajdź "kotwicę": Q z R=1
+        return list(graph.select_edges(EdgeType.Q, R=1))
 
-            # 4. Sprawdź czy jakakolwiek zmiana jest potrzebna
-            if all(e.get_parameters().get("R") == 1 for e in boundary_edges):
-                continue
+    def candidates(self, graph: Hypergraph) -> list[Edge]:
+        q_edges = self._q_edges(graph)
+        if not self._vectorized:
+            return q_edges
+        closed = closed_elements(graph, q_edges)
+        return [q for q in q_edges if q in closed]
 
-            # 5. Aplikacja zmian (Ustawienie R=1 dla krawędzi E)
-            for edge in boundary_edges:
-                if edge.get_parameters().get("R", 0) == 0:
-                    new_params = edge.get_parameters().copy()
-                    new_params["R"] = 1
-                    new_e = Edge(EdgeType.E, edge.get_vertices(), new_params)
-                    
-                    graph.remove_edge(edge)
-                    graph.add_edge(new_e)
+    def rewrite(self, graph: Hypergraph, candidate: Edge) -> Optional[Rewrite]:
+        if len(candidate.get_vertices()) != 6:
+            return None
 
-            return graph
+        # 2. Znajdź właściwą kolejność wierzchołków tworzącą cykl E
+        # Obchodzimy brzeg po indeksie incydencji zamiast sprawdzać permutacje
+        valid_cycle = boundary_cycle(graph, candidate.get_vertices())
 
-        return None
+        if valid_cycle is None:
+            return None # Nie znaleziono pełnego obwodu E wokół tego Q
 
-    def _e_edges_match(self, graph: Hypergraph, edges_vertices: frozenset[str]) -> bool:
-        """Sprawdza czy istnieje krawędź E o zadanych wierzchołkach."""
-        for edge in graph.get_edges():
-            if edge.get_type() == EdgeType.E and edge.get_vertices() == edges_vertices:
-                return True
-        return False
+        # 3. Zbierz krawędzie z tego cyklu
+        boundary_edges = self._get_edges_from_cycle(graph, valid_cycle)
 
-    def _check_cycle(self, graph: Hypergraph, cycle: tuple[str, ...]) -> bool:
-        """Sprawdza czy podana sekwencja wierzchołków tworzy zamknięty cykl krawędzi E."""
-        for i in range(len(cycle)):
-            v1 = cycle[i]
-            v2 = cycle[(i + 1) % len(cycle)] # % len zapewnia zamknięcie pętli (ostatni z pierwszym)
-            if not self._e_edges_match(graph, frozenset([v1, v2])):
-                return False
-        return True
+        # 4. Sprawdź czy jakakolwiek zmiana jest potrzebna
+        stale_edges = [e for e in boundary_edges if e.get_parameters().get("R", 0) == 0]
+        if not stale_edges:
+            return None
+
+        new_edges = []
+        for edge in stale_edges:
+            new_params = edge.get_parameters().copy()
+            new_params["R"] = 1
+            new_edges.append(Edge(EdgeType.E, edge.get_vertices(), new_params))
+
+        return Rewrite(
+            region=candidate.get_vertices(),
+            remove=frozenset(stale_edges),
+            add=frozenset(new_edges),
+        )
 
     def _get_edges_from_cycle(self, graph: Hypergraph, cycle: tuple[str, ...]) -> list[Edge]:
         """Pobiera obiekty krawędzi dla zweryfikowanego cyklu."""
@@ -75,11 +78,7 @@ class Prod10:
         for i in range(len(cycle)):
             v1 = cycle[i]
             v2 = cycle[(i + 1) % len(cycle)]
-            target = frozenset([v1, v2])
-            
+
             # Znajdź konkretny obiekt krawędzi w grafie
-            for edge in graph.get_edges():
-                if edge.get_type() == EdgeType.E and edge.get_vertices() == target:
-                    found_edges.append(edge)
-                    break
+            found_edges.extend(e_edges_between(graph, v1, v2)[:1])
         return found_edges
\ No newline at end of file
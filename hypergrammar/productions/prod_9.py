@@ -1,9 +1,11 @@
 from typing import Optional
 from hypergrammar.hypergraph import Hypergraph
 from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.productions.i_prod import IProd
+from hypergrammar.productions.rewrite import Rewrite
 from hypergrammar.rfc import RFC
 
-class Prod9:
+class Prod9(IProd):
     """
     P9: Oznaczenie elementu (Q) do refinacji.
     """
@@ -11,32 +13,42 @@ class Prod9:
         self._rfc = rfc
 
     def apply(self, graph: Hypergraph) -> Hypergraph | None:
-        # 1. Znajdź kandydatów: Q z R=0
-        candidates = [
-            e for e in graph.get_edges()
-            if e.get_type() == EdgeType.Q and e.get_parameters().get("R", 0) == 0
-        ]
-
-        for edge in candidates:
-            # 2. Walidacja topologiczna (heksagon = 6 wierzchołków)
-            if len(edge.get_vertices()) != 6:
-                continue
-
-            # 3. Walidacja RFC (używając metody pomocniczej)
-            if not self._validate_edge(edge, graph):
+        for edge in self.candidates(graph):
+            rewrite = self.rewrite(graph, edge)
+            if rewrite is None:
                 continue
 
             # 4. Aplikacja produkcji (Zmiana R=0 -> R=1)
-            new_params = edge.get_parameters().copy()
-            new_params["R"] = 1
-            new_edge = Edge(EdgeType.Q, edge.get_vertices(), new_params)
-
-            graph.remove_edge(edge)
-            graph.add_edge(new_edge)
+            rewrite.commit(graph)
             return graph
 
         return None
 
+    def candidates(self, graph: Hypergraph) -> list[Edge]:
+        # 1. Znajdź kandydatów: Q z R=0
+        return list(graph.select_edges(
+            EdgeType.Q, predicate=lambda e: e.get_parameters().get("R", 0) == 0
+        ))
+
+    def rewrite(self, graph: Hypergraph, candidate: Edge) -> Optional[Rewrite]:
+        # 2. Walidacja topologiczna (heksagon = 6 wierzchołków)
+        if len(candidate.get_vertices()) != 6:
+            return None
+
+        # 3. Walidacja RFC (używając metody pomocniczej)
+        if not self._validate_edge(candidate, graph):
+            return None
+
+        new_params = candidate.get_parameters().copy()
+        new_params["R"] = 1
+        new_edge = Edge(EdgeType.Q, candidate.get_vertices(), new_params)
+
+        return Rewrite(
+            region=candidate.get_vertices(),
+            remove=frozenset([candidate]),
+            add=frozenset([new_edge]),
+        )
+
     def _validate_edge(self, q_edge: Edge, graph: Hypergraph) -> bool:
         """Sprawdza kryteria refinacji (Lokalne -> Globalne -> Domyślne True)."""
         # 1. Sprawdź lokalne RFC wstrzyknięte do produkcji
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from hypergrammar.edge import Edge
+from hypergrammar.hypergraph import Hypergraph
+
+
+@dataclass(frozen=True)
+class Rewrite:
+    """A matched, not yet applied production step.
+
+    `region` holds every vertex the match read or writes; two rewrites with
+    disjoint regions are independent and can be committed in any order.
+    """
+
+    region: frozenset[str]
+    remove: frozenset[Edge]
+    add: frozenset[Edge]
+
+    def is_applicable(self, graph: Hypergraph) -> bool:
+        """Check that the edges this rewrite replaces are still in `graph`."""
+        return all(graph.has_edge(edge) for edge in self.remove)
+
+    def commit(self, graph: Hypergraph) -> None:
+        with graph.batch():
+            for edge in self.remove:
+                graph.remove_edge(edge)
+            for edge in self.add:
+                graph.add_edge(edge)
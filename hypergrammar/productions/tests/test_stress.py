@@ -0,0 +1,222 @@
+import itertools
+import random
+import time
+
+import pytest
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.meshes import hex_grid, quad_grid
+from hypergrammar.parallel import ConcurrentRewriter
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.productions.prod_10 import Prod10
+
+SEEDS = [0, 1, 2]
+
+# growing the mesh 4x may cost at most this factor in time (linear ~4, quadratic ~16)
+SCALING_BUDGET = 10.0
+
+
+def _drop_e_edges(graph: Hypergraph, rng: random.Random, fraction: float) -> Hypergraph:
+    """Break some element boundaries by removing random E edges."""
+    e_edges = sorted(
+        (e for e in graph.get_edges() if e.get_type() == EdgeType.E),
+        key=lambda e: sorted(e.get_vertices()),
+    )
+    for edge in rng.sample(e_edges, int(len(e_edges) * fraction)):
+        graph.remove_edge(edge)
+    return graph
+
+
+def _closed_by_brute_force(edges: set[Edge], vertices: frozenset[str]) -> list[str] | None:
+    """Reference boundary check: try every vertex ordering."""
+    pairs = {e.get_vertices() for e in edges if e.get_type() == EdgeType.E}
+    for perm in itertools.permutations(sorted(vertices)):
+        if all(
+            frozenset([perm[i], perm[(i + 1) % len(perm)]]) in pairs
+            for i in range(len(perm))
+        ):
+            return list(perm)
+    return None
+
+
+def _reference_prod0(edges: set[Edge]) -> set[Edge]:
+    for q in [e for e in edges if e.get_type() == EdgeType.Q and e.get_parameters().get("R") == 0]:
+        if _closed_by_brute_force(edges, q.get_vertices()) is not None:
+            edges = (edges - {q}) | {Edge(EdgeType.Q, q.get_vertices(), {"R": 1})}
+    return edges
+
+
+def _reference_prod9_prod10(edges: set[Edge]) -> set[Edge]:
+    for q in [e for e in edges if e.get_type() == EdgeType.Q]:
+        if len(q.get_vertices()) == 6 and q.get_parameters().get("R", 0) == 0:
+            edges = (edges - {q}) | {
+                Edge(EdgeType.Q, q.get_vertices(), {**q.get_parameters(), "R": 1})
+            }
+    for q in [e for e in edges if e.get_type() == EdgeType.Q]:
+        cycle = _closed_by_brute_force(edges, q.get_vertices())
+        if cycle is None or q.get_parameters().get("R") != 1:
+            continue
+        for i, v1 in enumerate(cycle):
+            pair = frozenset([v1, cycle[(i + 1) % len(cycle)]])
+            for e in [e for e in edges if e.get_type() == EdgeType.E and e.get_vertices() == pair]:
+                if e.get_parameters().get("R", 0) == 0:
+                    edges = (edges - {e}) | {
+                        Edge(EdgeType.E, pair, {**e.get_parameters(), "R": 1})
+                    }
+    return edges
+
+
+def _sequential(graph: Hypergraph, productions) -> Hypergraph:
+    progress = True
+    while progress:
+        progress = False
+        for production in productions:
+            while production.apply(graph) is not None:
+                progress = True
+    return graph
+
+
+def _best_time(build, run, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        graph = build()
+        start = time.perf_counter()
+        run(graph)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class TestProductionsStress:
+    """Randomized differential and scaling tests on generated meshes."""
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_prod0_quad_mesh_differential(self, seed):
+        """Test that P0 engines agree with the brute-force reference on random quad meshes."""
+        # Arrange
+        def build():
+            rng = random.Random(seed)
+            return _drop_e_edges(quad_grid(8, 8, rng), rng, 0.05)
+
+        expected = _reference_prod0(set(build().get_edges()))
+
+        # Act
+        sequential = _sequential(build(), [Prod0()])
+        concurrent = build()
+        ConcurrentRewriter([Prod0()], max_workers=4).run(concurrent)
+
+        # Assert
+        assert sequential.get_edges() == expected
+        assert concurrent.get_edges() == expected
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_prod9_prod10_hex_mesh_differential(self, seed):
+        """Test that P9/P10 engines agree with the brute-force reference on random hex meshes."""
+        # Arrange
+        def build():
+            rng = random.Random(seed)
+            return _drop_e_edges(hex_grid(6, 6, rng), rng, 0.05)
+
+        expected = _reference_prod9_prod10(set(build().get_edges()))
+
+        # Act
+        sequential = _sequential(build(), [Prod9(), Prod10()])
+        concurrent = build()
+        ConcurrentRewriter([Prod9(), Prod10()], max_workers=4).run(concurrent)
+
+        # Assert
+        assert sequential.get_edges() == expected
+        assert concurrent.get_edges() == expected
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_vectorized_validation_differential(self, seed):
+        """Test that batch boundary validation gives the same fixpoints."""
+        pytest.importorskip("numpy")
+
+        # Arrange
+        def quads():
+            rng = random.Random(seed)
+            return _drop_e_edges(quad_grid(8, 8, rng), rng, 0.05)
+
+        def hexes():
+            rng = random.Random(seed)
+            return _drop_e_edges(hex_grid(6, 6, rng), rng, 0.05)
+
+        expected_quads = _reference_prod0(set(quads().get_edges()))
+        expected_hexes = _reference_prod9_prod10(set(hexes().get_edges()))
+
+        # Act
+        sequential = _sequential(quads(), [Prod0(vectorized=True)])
+        concurrent = hexes()
+        ConcurrentRewriter([Prod9(), Prod10(vectorized=True)], max_workers=4).run(concurrent)
+
+        # Assert
+        assert sequential.get_edges() == expected_quads
+        assert concurrent.get_edges() == expected_hexes
+
+    @pytest.mark.parametrize(
+        "build, productions",
+        [
+            (quad_grid, [Prod0]),
+            (hex_grid, [Prod9, Prod10]),
+        ],
+        ids=["prod0-quads", "prod9-prod10-hexes"],
+    )
+    def test_fixpoint_scales_linearly(self, build, productions):
+        """Test that refining a 4x larger mesh to fixpoint stays within the scaling budget."""
+        # Arrange
+        def run(graph):
+            ConcurrentRewriter([p() for p in productions]).run(graph)
+
+        # Act
+        small = _best_time(lambda: build(15, 15), run)
+        large = _best_time(lambda: build(30, 30), run)
+
+        # Assert
+        assert large / small < SCALING_BUDGET, (
+            f"{large:.3f}s vs {small:.3f}s for 4x the elements"
+        )
+
+    @pytest.mark.parametrize(
+        "build, production",
+        [(quad_grid, Prod0), (hex_grid, Prod9)],
+        ids=["prod0", "prod9"],
+    )
+    def test_single_apply_scales_linearly(self, build, production):
+        """Test that one production application stays within the scaling budget."""
+        # Arrange
+        def run(graph):
+            production().apply(graph)
+
+        # Act
+        small = _best_time(lambda: build(30, 30), run, repeat=5)
+        large = _best_time(lambda: build(60, 60), run, repeat=5)
+
+        # Assert
+        assert large / small < SCALING_BUDGET, (
+            f"{large:.4f}s vs {small:.4f}s for 4x the elements"
+        )
+
+    @pytest.mark.parametrize(
+        "build, productions",
+        [
+            (quad_grid, lambda vectorized: [Prod0(vectorized=vectorized)]),
+            (hex_grid, lambda vectorized: [Prod9(), Prod10(vectorized=vectorized)]),
+        ],
+        ids=["prod0-quads", "prod9-prod10-hexes"],
+    )
+    def test_vectorized_apply_costs_no_more(self, build, productions):
+        """Test that `vectorized=True` does not slow down the single-step apply() path."""
+        pytest.importorskip("numpy")
+
+        # Arrange
+        def run(vectorized):
+            return lambda graph: _sequential(graph, productions(vectorized))
+
+        # Act
+        plain = _best_time(lambda: build(12, 12), run(False), repeat=2)
+        vectorized = _best_time(lambda: build(12, 12), run(True), repeat=2)
+
+        # Assert
+        assert vectorized / plain < 2.0, f"{vectorized:.3f}s vs {plain:.3f}s"
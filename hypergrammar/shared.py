@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import struct
+import sys
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from types import TracebackType
+from typing import Any, Mapping, Optional, Sized
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.rfc import RFC
+
+_MAGIC = 0x48475348  # "HGSH"
+_HEADER = struct.Struct("<9q")
+_INT = 8
+_TRACKER_LOCK = threading.Lock()
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    if shm.buf is None:
+        raise ValueError(f"Shared memory block {shm.name} is closed")
+    return shm.buf
+
+
+def _open_untracked(block: str) -> shared_memory.SharedMemory:
+    """Map an existing block without handing it to our resource tracker.
+
+    Before Python 3.13 attaching registers the block with the attaching
+    process' resource tracker, which unlinks it when that process exits, so
+    a worker outside the exporter's multiprocessing tree would destroy the
+    block under everyone else. Only the exporter may own it.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=block, track=False)
+
+    with _TRACKER_LOCK:
+        register = resource_tracker.register
+
+        def register_others(name: Sized, rtype: str) -> None:
+            if rtype != "shared_memory":
+                register(name, rtype)
+
+        resource_tracker.register = register_others
+        try:
+            return shared_memory.SharedMemory(name=block)
+        finally:
+            resource_tracker.register = register
+
+
+class SharedHypergraph:
+    """Read-only view of a `Hypergraph` stored in shared memory.
+
+    `export` packs the graph into a single `multiprocessing.shared_memory`
+    block: a string table (vertex names first, then parameter names) and
+    int64 arrays in CSR layout for edge vertices, edge parameters and vertex
+    parameters. Worker processes `attach` by block name without copying and
+    query it through the same read API as `Hypergraph`; `Edge` objects are
+    only built for the parts that are actually read, once per edge.
+
+    The process that exported the graph owns the block and must `unlink` it
+    once all workers are done.
+    """
+
+    def __init__(
+        self, shm: shared_memory.SharedMemory, rfc: Optional[RFC] = None
+    ) -> None:
+        self._shm = shm
+        self._rfc = rfc
+        buf = _buffer(shm)
+        header = _HEADER.unpack_from(buf, 0)
+        if header[0] != _MAGIC:
+            raise ValueError(f"Shared memory block {shm.name} is not a hypergraph")
+        (
+            _,
+            n_strings,
+            blob_len,
+            n_vertices,
+            n_edges,
+            n_incidence,
+            n_edge_params,
+            n_vertex_params,
+            n_ints,
+        ) = header
+        self._n_vertices = n_vertices
+        self._n_edges = n_edges
+
+        self._ints = buf[_HEADER.size : _HEADER.size + n_ints * _INT].cast("q")
+        blob_start = _HEADER.size + n_ints * _INT
+        self._blob = buf[blob_start : blob_start + blob_len]
+
+        sizes = [
+            n_strings + 1,  # string offsets
+            n_edges,  # edge types
+            n_edges + 1,  # edge vertex offsets
+            n_incidence,  # edge vertices
+            n_edges + 1,  # edge parameter offsets
+            n_edge_params,  # edge parameter keys
+            n_edge_params,  # edge parameter values
+            n_vertices + 1,  # vertex parameter offsets
+            n_vertex_params,  # vertex parameter keys
+            n_vertex_params,  # vertex parameter values
+        ]
+        arrays = []
+        start = 0
+        for size in sizes:
+            arrays.append(self._ints[start : start + size])
+            start += size
+        (
+            self._string_offsets,
+            self.edge_types,
+            self.edge_offsets,
+            self.edge_vertices,
+            self._edge_param_offsets,
+            self._edge_param_keys,
+            self._edge_param_values,
+            self._vertex_param_offsets,
+            self._vertex_param_keys,
+            self._vertex_param_values,
+        ) = arrays
+
+        # decoded lazily and kept, the block is immutable once exported
+        self._strings: dict[int, str] = {}
+        self._edges: list[Optional[Edge]] = [None] * n_edges
+        self._edge_set: Optional[frozenset[Edge]] = None
+        self._vertex_index: Optional[dict[str, int]] = None
+        self._incidence: Optional[list[list[int]]] = None
+        self._incident_edges: dict[int, frozenset[Edge]] = {}
+
+    @classmethod
+    def export(
+        cls, graph: Hypergraph, name: Optional[str] = None
+    ) -> SharedHypergraph:
+        """Copy `graph` into a new shared memory block and return its view."""
+        edges = list(graph.get_edges())
+        vertex_parameters = {
+            vertex: graph.get_vertex_parameters(vertex)
+            for vertex in graph.get_vertices()
+        }
+        vertices = sorted(vertex_parameters)
+        vertex_ids = {vertex: i for i, vertex in enumerate(vertices)}
+
+        strings = list(vertices)
+        string_ids = dict(vertex_ids)
+
+        def string_id(value: str) -> int:
+            if value not in string_ids:
+                string_ids[value] = len(strings)
+                strings.append(value)
+            return string_ids[value]
+
+        edge_types: list[int] = []
+        edge_offsets = [0]
+        edge_vertices: list[int] = []
+        edge_param_offsets = [0]
+        edge_param_keys: list[int] = []
+        edge_param_values: list[int] = []
+        for edge in edges:
+            edge_types.append(edge.get_type().value)
+            edge_vertices.extend(vertex_ids[v] for v in sorted(edge.get_vertices()))
+            edge_offsets.append(len(edge_vertices))
+            for key, value in edge.get_parameters().items():
+                edge_param_keys.append(string_id(key))
+                edge_param_values.append(value)
+            edge_param_offsets.append(len(edge_param_keys))
+
+        vertex_param_offsets = [0]
+        vertex_param_keys: list[int] = []
+        vertex_param_values: list[int] = []
+        for vertex in vertices:
+            for key, value in vertex_parameters[vertex].items():
+                vertex_param_keys.append(string_id(key))
+                vertex_param_values.append(value)
+            vertex_param_offsets.append(len(vertex_param_keys))
+
+        encoded = [s.encode("utf-8") for s in strings]
+        string_offsets = [0]
+        for chunk in encoded:
+            string_offsets.append(string_offsets[-1] + len(chunk))
+        blob = b"".join(encoded)
+
+        ints = (
+            string_offsets
+            + edge_types
+            + edge_offsets
+            + edge_vertices
+            + edge_param_offsets
+            + edge_param_keys
+            + edge_param_values
+            + vertex_param_offsets
+            + vertex_param_keys
+            + vertex_param_values
+        )
+        size = _HEADER.size + len(ints) * _INT + len(blob)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        buf = _buffer(shm)
+        _HEADER.pack_into(
+            buf,
+            0,
+            _MAGIC,
+            len(strings),
+            len(blob),
+            len(vertices),
+            len(edges),
+            len(edge_vertices),
+            len(edge_param_keys),
+            len(vertex_param_keys),
+            len(ints),
+        )
+        struct.pack_into(f"<{len(ints)}q", buf, _HEADER.size, *ints)
+        blob_start = _HEADER.size + len(ints) * _INT
+        buf[blob_start : blob_start + len(blob)] = blob
+        return cls(shm, graph.get_rfc())
+
+    @classmethod
+    def attach(cls, name: str, rfc: Optional[RFC] = None) -> SharedHypergraph:
+        """Map an exported block by `name` without copying it."""
+        return cls(_open_untracked(name), rfc)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def _string(self, index: int) -> str:
+        value = self._strings.get(index)
+        if value is None:
+            start = self._string_offsets[index]
+            end = self._string_offsets[index + 1]
+            value = bytes(self._blob[start:end]).decode("utf-8")
+            self._strings[index] = value
+        return value
+
+    def _vertex_id(self, vertex: str) -> Optional[int]:
+        if self._vertex_index is None:
+            self._vertex_index = {
+                self._string(i): i for i in range(self._n_vertices)
+            }
+        return self._vertex_index.get(vertex)
+
+    def edge(self, index: int) -> Edge:
+        """Return the `Edge` stored at row `index`, decoding it on first use."""
+        edge = self._edges[index]
+        if edge is None:
+            edge = self._decode_edge(index)
+            self._edges[index] = edge
+        return edge
+
+    def _decode_edge(self, index: int) -> Edge:
+        vertices = frozenset(
+            self._string(v)
+            for v in self.edge_vertices[
+                self.edge_offsets[index] : self.edge_offsets[index + 1]
+            ]
+        )
+        start = self._edge_param_offsets[index]
+        end = self._edge_param_offsets[index + 1]
+        parameters = {
+            self._string(self._edge_param_keys[i]): self._edge_param_values[i]
+            for i in range(start, end)
+        }
+        return Edge(EdgeType(self.edge_types[index]), vertices, parameters)
+
+    def get_edges(self) -> frozenset[Edge]:
+        if self._edge_set is None:
+            self._edge_set = frozenset(self.edge(i) for i in range(self._n_edges))
+        return self._edge_set
+
+    def get_vertices(self) -> frozenset[str]:
+        return frozenset(self._string(i) for i in range(self._n_vertices))
+
+    def incident_edge_indexes(self, vertex: str) -> list[int]:
+        """Rows of the edges containing `vertex`, without building `Edge` objects."""
+        vertex_id = self._vertex_id(vertex)
+        if vertex_id is None:
+            return []
+        if self._incidence is None:
+            self._incidence = [[] for _ in range(self._n_vertices)]
+            for index in range(self._n_edges):
+                for v in self.edge_vertices[
+                    self.edge_offsets[index] : self.edge_offsets[index + 1]
+                ]:
+                    self._incidence[v].append(index)
+        return self._incidence[vertex_id]
+
+    def get_incident_edges(self, vertex: str) -> frozenset[Edge]:
+        vertex_id = self._vertex_id(vertex)
+        if vertex_id is None:
+            return frozenset()
+        edges = self._incident_edges.get(vertex_id)
+        if edges is None:
+            edges = frozenset(self.edge(i) for i in self.incident_edge_indexes(vertex))
+            self._incident_edges[vertex_id] = edges
+        return edges
+
+    def get_e_edges(self, v1: str, v2: str) -> frozenset[Edge]:
+        """Return the E edges joining `v1` and `v2`."""
+        pair = frozenset([v1, v2])
+        return frozenset(
+            edge
+            for edge in self.get_incident_edges(v1)
+            if edge.get_type() == EdgeType.E and edge.get_vertices() == pair
+        )
+
+    def get_vertex_parameters(self, vertex: str) -> dict[str, int]:
+        vertex_id = self._vertex_id(vertex)
+        if vertex_id is None:
+            return {}
+        start = self._vertex_param_offsets[vertex_id]
+        end = self._vertex_param_offsets[vertex_id + 1]
+        return {
+            self._string(self._vertex_param_keys[i]): self._vertex_param_values[i]
+            for i in range(start, end)
+        }
+
+    def get_rfc(self) -> Optional[RFC]:
+        return self._rfc
+
+    def edge_rfc_is_valid(
+        self, edge: Edge, meta: Optional[Mapping[str, Any]] = None
+    ) -> Optional[bool]:
+        if self._rfc is None:
+            return None
+
+        # RFCs only use the read API, which this view provides
+        return bool(self._rfc.is_valid(edge, self, meta))  # type: ignore[arg-type]
+
+    def to_hypergraph(self) -> Hypergraph:
+        """Copy the view back into a mutable `Hypergraph`."""
+        graph = Hypergraph(self._rfc)
+        for edge in self.get_edges():
+            graph.add_edge(edge)
+        for vertex in self.get_vertices():
+            parameters = self.get_vertex_parameters(vertex)
+            if parameters:
+                graph.set_vertex_parameter(vertex, parameters)
+        return graph
+
+    def close(self) -> None:
+        """Release this process' mapping of the block."""
+        for view in (
+            self._string_offsets,
+            self.edge_types,
+            self.edge_offsets,
+            self.edge_vertices,
+            self._edge_param_offsets,
+            self._edge_param_keys,
+            self._edge_param_values,
+            self._vertex_param_offsets,
+            self._vertex_param_keys,
+            self._vertex_param_values,
+            self._ints,
+            self._blob,
+        ):
+            view.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the block; call once, from the exporting process."""
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedHypergraph:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,165 @@
+import hashlib
+from typing import Hashable, Optional
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.utils import canonical_dihedral, canonical_rotation
+
+Parameters = tuple[tuple[str, int], ...]
+Signature = tuple[Hashable, ...]
+
+
+def freeze_parameters(parameters: dict[str, int]) -> Parameters:
+    return tuple(sorted(parameters.items()))
+
+
+def e_edges_between(graph: Hypergraph, v1: str, v2: str) -> list[Edge]:
+    """Return every E edge joining `v1` and `v2` using the pair index."""
+    return sorted(graph.get_e_edges(v1, v2), key=lambda e: sorted(e.get_parameters().items()))
+
+
+def boundary_cycle(
+    graph: Hypergraph, vertices: frozenset[str]
+) -> Optional[tuple[str, ...]]:
+    """Order `vertices` into a closed cycle of E edges.
+
+    Returns the cycle in `canonical_rotation` form or None if the E edges
+    between `vertices` do not close a cycle through all of them. When every
+    vertex has exactly two neighbours (the usual mesh case) the cycle is
+    walked in O(k); otherwise a depth-first search over the local adjacency
+    is used.
+    """
+    adjacency: dict[str, set[str]] = {vertex: set() for vertex in vertices}
+    for vertex in vertices:
+        for edge in graph.get_incident_edges(vertex):
+            if edge.get_type() != EdgeType.E:
+                continue
+            for other in edge.get_vertices():
+                if other != vertex and other in adjacency:
+                    adjacency[vertex].add(other)
+
+    if len(vertices) < 3 or any(len(n) < 2 for n in adjacency.values()):
+        return None
+
+    start = min(vertices)
+    if all(len(n) == 2 for n in adjacency.values()):
+        cycle = [start]
+        previous, current = start, min(adjacency[start])
+        while current != start:
+            cycle.append(current)
+            previous, current = current, next(
+                v for v in adjacency[current] if v != previous
+            )
+        if len(cycle) != len(vertices):
+            return None
+        return canonical_rotation(cycle)
+
+    path = [start]
+    visited = {start}
+
+    def extend() -> bool:
+        if len(path) == len(vertices):
+            return start in adjacency[path[-1]]
+        for neighbour in sorted(adjacency[path[-1]]):
+            if neighbour in visited:
+                continue
+            path.append(neighbour)
+            visited.add(neighbour)
+            if extend():
+                return True
+            path.pop()
+            visited.discard(neighbour)
+        return False
+
+    if not extend():
+        return None
+    return canonical_rotation(path)
+
+
+def local_signature(
+    graph: Hypergraph, q_edge: Edge, cycle: tuple[str, ...]
+) -> Signature:
+    """Vertex-name independent signature of `q_edge` and its boundary.
+
+    The signature holds the Q edge parameters and the parameters of the
+    boundary E edges read along `cycle`, normalised over rotation and
+    direction, so any two structurally identical neighbourhoods share it.
+    """
+    ring = []
+    for i, v1 in enumerate(cycle):
+        v2 = cycle[(i + 1) % len(cycle)]
+        ring.append(
+            tuple(
+                sorted(
+                    freeze_parameters(edge.get_parameters())
+                    for edge in e_edges_between(graph, v1, v2)
+                )
+            )
+        )
+
+    return (
+        q_edge.get_type().name,
+        len(cycle),
+        freeze_parameters(q_edge.get_parameters()),
+        canonical_dihedral(ring),
+    )
+
+
+def _digest(value: Hashable) -> str:
+    # repr of nested tuples of str/int is canonical, unlike salted hash()
+    return hashlib.blake2b(repr(value).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def graph_signature(graph: Hypergraph, rounds: int = 3) -> int:
+    """Hash of `graph` that does not depend on vertex names.
+
+    Vertices are repeatedly relabelled by the parameters of their incident
+    edges (Weisfeiler-Lehman style). Isomorphic graphs always hash equal;
+    different graphs almost always differ, so use it to short-circuit
+    comparisons, not to prove equality. The value is a BLAKE2 digest, so it
+    is the same across processes and Python versions.
+    """
+    vertices = {v for edge in graph.get_edges() for v in edge.get_vertices()}
+    colours: dict[str, str] = {vertex: "" for vertex in vertices}
+
+    for _ in range(rounds):
+        colours = {
+            vertex: _digest(
+                (
+                    colours[vertex],
+                    tuple(
+                        sorted(
+                            (
+                                edge.get_type().name,
+                                freeze_parameters(edge.get_parameters()),
+                                tuple(
+                                    sorted(
+                                        colours[v]
+                                        for v in edge.get_vertices()
+                                        if v != vertex
+                                    )
+                                ),
+                            )
+                            for edge in graph.get_incident_edges(vertex)
+                        )
+                    ),
+                )
+            )
+            for vertex in vertices
+        }
+
+    return int(
+        _digest(
+            tuple(
+                sorted(
+                    (
+                        edge.get_type().name,
+                        freeze_parameters(edge.get_parameters()),
+                        tuple(sorted(colours[v] for v in edge.get_vertices())),
+                    )
+                    for edge in graph.get_edges()
+                )
+            )
+        ),
+        16,
+    )
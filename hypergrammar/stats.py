@@ -0,0 +1,119 @@
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.utils import get_edge_color
+
+Position = tuple[float, float]
+PositionLookup = Callable[[str], Optional[Position]]
+
+
+def element_area(vertices: Iterable[str], position: PositionLookup) -> Optional[float]:
+    """Area of the polygon spanned by `vertices`, or None without coordinates.
+
+    Vertices are ordered by angle around their centroid, which is exact for
+    the convex quads and hexagons the productions work on.
+    """
+    points = []
+    for vertex in vertices:
+        point = position(vertex)
+        if point is None:
+            return None
+        points.append(point)
+    if len(points) < 3:
+        return None
+
+    cx = sum(x for x, _ in points) / len(points)
+    cy = sum(y for _, y in points) / len(points)
+    points.sort(key=lambda p: math.atan2(p[1] - cy, p[0] - cx))
+    twice_area = 0.0
+    for i, (x1, y1) in enumerate(points):
+        x2, y2 = points[(i + 1) % len(points)]
+        twice_area += x1 * y2 - x2 * y1
+    return abs(twice_area) / 2
+
+
+@dataclass(frozen=True)
+class GraphStats:
+    """Snapshot of the aggregates a `Hypergraph` keeps up to date."""
+
+    edge_counts: dict[EdgeType, int] = field(default_factory=dict)
+    parameter_counts: dict[tuple[EdgeType, str, int], int] = field(default_factory=dict)
+    colour_counts: dict[tuple[EdgeType, str], int] = field(default_factory=dict)
+    element_area: float = 0.0
+    parameter_area: dict[tuple[str, int], float] = field(default_factory=dict)
+
+    def count(self, edge_type: EdgeType, parameter: Optional[str] = None, value: int = 1) -> int:
+        """Number of `edge_type` edges, optionally only those with `parameter` == `value`."""
+        if parameter is None:
+            return self.edge_counts.get(edge_type, 0)
+        return self.parameter_counts.get((edge_type, parameter, value), 0)
+
+    @property
+    def marked_area(self) -> float:
+        """Total area of Q elements with R=1."""
+        return self.parameter_area.get(("R", 1), 0.0)
+
+
+class StatsTracker:
+    """Updates `GraphStats` aggregates in O(1) per edge mutation."""
+
+    def __init__(self) -> None:
+        self._edge_counts: Counter[EdgeType] = Counter()
+        self._parameter_counts: Counter[tuple[EdgeType, str, int]] = Counter()
+        self._colour_counts: Counter[tuple[EdgeType, str]] = Counter()
+        self._areas: dict[Edge, float] = {}
+        self._element_area = 0.0
+        self._parameter_area: dict[tuple[str, int], float] = {}
+
+    def _count(self, edge: Edge, step: int) -> None:
+        edge_type = edge.get_type()
+        self._edge_counts[edge_type] += step
+        for key, value in edge.get_parameters().items():
+            self._parameter_counts[(edge_type, key, value)] += step
+        self._colour_counts[(edge_type, get_edge_color(edge))] += step
+
+    def _add_area(self, edge: Edge, position: PositionLookup) -> None:
+        if edge.get_type() != EdgeType.Q:
+            return
+        area = element_area(edge.get_vertices(), position)
+        if area is None:
+            return
+        self._areas[edge] = area
+        self._element_area += area
+        for item in edge.get_parameters().items():
+            self._parameter_area[item] = self._parameter_area.get(item, 0.0) + area
+
+    def _remove_area(self, edge: Edge) -> None:
+        area = self._areas.pop(edge, None)
+        if area is None:
+            return
+        self._element_area -= area
+        for item in edge.get_parameters().items():
+            self._parameter_area[item] -= area
+
+    def edge_added(self, edge: Edge, position: PositionLookup) -> None:
+        self._count(edge, 1)
+        self._add_area(edge, position)
+
+    def edge_removed(self, edge: Edge) -> None:
+        self._count(edge, -1)
+        self._remove_area(edge)
+
+    def vertex_moved(self, edges: Iterable[Edge], position: PositionLookup) -> None:
+        """Recompute the areas of elements using a vertex whose position changed."""
+        for edge in edges:
+            if edge.get_type() == EdgeType.Q:
+                self._remove_area(edge)
+                self._add_area(edge, position)
+
+    def snapshot(self) -> GraphStats:
+        return GraphStats(
+            edge_counts={k: v for k, v in self._edge_counts.items() if v},
+            parameter_counts={k: v for k, v in self._parameter_counts.items() if v},
+            colour_counts={k: v for k, v in self._colour_counts.items() if v},
+            element_area=self._element_area,
+            parameter_area=dict(self._parameter_area),
+        )
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from typing import Iterable, Iterator, Optional, Sequence
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.events import GraphDelta
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.parallel import ConcurrentRewriter
+from hypergrammar.productions.i_prod import IProd
+from hypergrammar.productions.rewrite import Rewrite
+
+Region = tuple[int, int, int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vertices (
+    name TEXT PRIMARY KEY,
+    parameters TEXT NOT NULL,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS edges (
+    key TEXT PRIMARY KEY,
+    type INTEGER NOT NULL,
+    vertices TEXT NOT NULL,
+    parameters TEXT NOT NULL,
+    min_x INTEGER NOT NULL,
+    min_y INTEGER NOT NULL,
+    max_x INTEGER NOT NULL,
+    max_y INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS edges_min_x ON edges (min_x, min_y);
+CREATE INDEX IF NOT EXISTS edges_max_x ON edges (max_x, max_y);
+"""
+
+
+def _edge_key(edge: Edge) -> str:
+    return json.dumps(
+        [edge.get_type().value, sorted(edge.get_vertices()), edge.get_parameters()],
+        sort_keys=True,
+    )
+
+
+def _position(vertex: str, parameters: dict[str, int]) -> tuple[int, int]:
+    if "x" not in parameters or "y" not in parameters:
+        raise ValueError(f"Vertex {vertex} needs 'x' and 'y' params for out-of-core storage.")
+    return parameters["x"], parameters["y"]
+
+
+class SQLiteGraphStore:
+    """Hypergraph kept in a SQLite database instead of Python objects.
+
+    Every edge row stores the bounding box of its vertices, so the edges of
+    a spatial region can be paged in with an indexed range query. Vertices
+    must carry integer "x" and "y" parameters.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:") -> None:
+        self._connection = sqlite3.connect(os.fspath(path))
+        self._connection.executescript(_SCHEMA)
+
+    @classmethod
+    def from_hypergraph(
+        cls, graph: Hypergraph, path: str | os.PathLike[str] = ":memory:"
+    ) -> SQLiteGraphStore:
+        store = cls(path)
+        store.add(graph.get_edges(), graph)
+        return store
+
+    def add(self, edges: Iterable[Edge], graph: Hypergraph) -> None:
+        """Store `edges` and their vertices, reading positions from `graph`."""
+        with self._connection:
+            for edge in edges:
+                positions = []
+                for vertex in edge.get_vertices():
+                    parameters = graph.get_vertex_parameters(vertex)
+                    positions.append(_position(vertex, parameters))
+                    self._put_vertex(vertex, parameters)
+                xs = [x for x, _ in positions]
+                ys = [y for _, y in positions]
+                self._connection.execute(
+                    "INSERT OR IGNORE INTO edges VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        _edge_key(edge),
+                        edge.get_type().value,
+                        json.dumps(sorted(edge.get_vertices())),
+                        json.dumps(edge.get_parameters(), sort_keys=True),
+                        min(xs),
+                        min(ys),
+                        max(xs),
+                        max(ys),
+                    ),
+                )
+
+    def _put_vertex(self, vertex: str, parameters: dict[str, int]) -> None:
+        x, y = _position(vertex, parameters)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO vertices VALUES (?, ?, ?, ?)",
+            (vertex, json.dumps(parameters, sort_keys=True), x, y),
+        )
+
+    def apply_delta(self, delta: GraphDelta, graph: Hypergraph) -> None:
+        """Write a delta recorded on a loaded region back to the store."""
+        with self._connection:
+            for vertex, parameters in delta.vertex_parameters.items():
+                self._put_vertex(vertex, parameters)
+            self._connection.executemany(
+                "DELETE FROM edges WHERE key = ?",
+                [(_edge_key(edge),) for edge in delta.removed],
+            )
+        self.add(delta.added, graph)
+
+    def edge_count(self, region: Optional[Region] = None) -> int:
+        if region is None:
+            row = self._connection.execute("SELECT COUNT(*) FROM edges").fetchone()
+        else:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM edges WHERE max_x >= ? AND min_x <= ? "
+                "AND max_y >= ? AND min_y <= ?",
+                (region[0], region[2], region[1], region[3]),
+            ).fetchone()
+        return int(row[0])
+
+    def bounds(self) -> Optional[Region]:
+        """Return (min_x, min_y, max_x, max_y) over all vertices."""
+        row = self._connection.execute(
+            "SELECT MIN(x), MIN(y), MAX(x), MAX(y) FROM vertices"
+        ).fetchone()
+        if row[0] is None:
+            return None
+        return int(row[0]), int(row[1]), int(row[2]), int(row[3])
+
+    def element_extent(self) -> int:
+        """Largest bounding box side of any stored Q element, 0 without elements."""
+        row = self._connection.execute(
+            "SELECT MAX(max_x - min_x), MAX(max_y - min_y) FROM edges WHERE type = ?",
+            (EdgeType.Q.value,),
+        ).fetchone()
+        return max(int(row[0] or 0), int(row[1] or 0))
+
+    def _rows(self, query: str, args: Sequence[int] = ()) -> Iterator[Edge]:
+        for edge_type, vertices, parameters in self._connection.execute(query, args):
+            yield Edge(
+                EdgeType(edge_type), frozenset(json.loads(vertices)), json.loads(parameters)
+            )
+
+    def _load(self, edges: Iterable[Edge]) -> Hypergraph:
+        graph = Hypergraph()
+        vertices: set[str] = set()
+        for edge in edges:
+            graph.add_edge(edge)
+            vertices.update(edge.get_vertices())
+        for vertex in vertices:
+            row = self._connection.execute(
+                "SELECT parameters FROM vertices WHERE name = ?", (vertex,)
+            ).fetchone()
+            if row is not None:
+                graph.set_vertex_parameter(vertex, json.loads(row[0]))
+        return graph
+
+    def load_region(self, region: Region) -> Hypergraph:
+        """Load every edge whose bounding box meets the inclusive `region`."""
+        return self._load(
+            self._rows(
+                "SELECT type, vertices, parameters FROM edges WHERE max_x >= ? "
+                "AND min_x <= ? AND max_y >= ? AND min_y <= ?",
+                (region[0], region[2], region[1], region[3]),
+            )
+        )
+
+    def to_hypergraph(self) -> Hypergraph:
+        return self._load(self._rows("SELECT type, vertices, parameters FROM edges"))
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class _OwnedProduction(IProd):
+    """Restricts a production to candidates anchored inside a tile."""
+
+    def __init__(self, production: IProd, tile: Region) -> None:
+        self._production = production
+        self._tile = tile
+
+    def _owns(self, graph: Hypergraph, edge: Edge) -> bool:
+        x, y = min(
+            _position(v, graph.get_vertex_parameters(v)) for v in edge.get_vertices()
+        )
+        x0, y0, x1, y1 = self._tile
+        return x0 <= x < x1 and y0 <= y < y1
+
+    def apply(self, graph: Hypergraph) -> Hypergraph | None:
+        for candidate in self.candidates(graph):
+            rewrite = self.rewrite(graph, candidate)
+            if rewrite is not None:
+                rewrite.commit(graph)
+                return graph
+        return None
+
+    def candidates(self, graph: Hypergraph) -> list[Edge]:
+        return [c for c in self._production.candidates(graph) if self._owns(graph, c)]
+
+    def rewrite(self, graph: Hypergraph, candidate: Edge) -> Optional[Rewrite]:
+        return self._production.rewrite(graph, candidate)
+
+
+def _tiles(
+    store: SQLiteGraphStore, tile: Region, halo: int, max_edges: Optional[int]
+) -> Iterator[Region]:
+    """Yield `tile`, split into quarters while its halo region is too large."""
+    x0, y0, x1, y1 = tile
+    region = (x0 - halo, y0 - halo, x1 + halo, y1 + halo)
+    if max_edges is None or store.edge_count(region) <= max_edges:
+        yield tile
+        return
+    if x1 - x0 <= 1 and y1 - y0 <= 1:
+        raise MemoryError(
+            f"Tile {tile} needs more than {max_edges} edges in memory, "
+            "even after splitting it to a single unit; raise max_edges."
+        )
+    xm, ym = max(x0 + 1, (x0 + x1) // 2), max(y0 + 1, (y0 + y1) // 2)
+    for sub in ((x0, y0, xm, ym), (xm, y0, x1, ym), (x0, ym, xm, y1), (xm, ym, x1, y1)):
+        if sub[0] < sub[2] and sub[1] < sub[3]:
+            yield from _tiles(store, sub, halo, max_edges)
+
+
+def refine_out_of_core(
+    store: SQLiteGraphStore,
+    productions: Sequence[IProd],
+    tile_size: int,
+    halo: Optional[int] = None,
+    max_edges: Optional[int] = None,
+    max_sweeps: Optional[int] = None,
+) -> int:
+    """Apply `productions` to a stored graph tile by tile.
+
+    Each tile is loaded together with a `halo` margin, so elements anchored
+    in the tile see their whole boundary; `halo` defaults to the largest
+    element extent in the store and a smaller one raises ValueError. Only
+    elements anchored (by their lowest vertex) inside the tile are rewritten
+    and the changes are written back before the next tile is loaded. Tiles
+    whose halo region holds more than `max_edges` edges are split. Sweeps
+    repeat until nothing changes, or `max_sweeps`.
+
+    Returns the number of applied rewrites.
+    """
+    bounds = store.bounds()
+    if bounds is None:
+        return 0
+    extent = store.element_extent()
+    if halo is None:
+        halo = extent
+    elif halo < extent:
+        raise ValueError(
+            f"A halo of {halo} cannot hold elements spanning {extent}; "
+            "their boundaries would be cut off and they would never be refined."
+        )
+
+    applied = 0
+    sweeps = 0
+    while max_sweeps is None or sweeps < max_sweeps:
+        sweeps += 1
+        sweep_applied = 0
+        for x in range(bounds[0], bounds[2] + 1, tile_size):
+            for y in range(bounds[1], bounds[3] + 1, tile_size):
+                for tile in _tiles(store, (x, y, x + tile_size, y + tile_size), halo, max_edges):
+                    region = (tile[0] - halo, tile[1] - halo, tile[2] + halo, tile[3] + halo)
+                    graph = store.load_region(region)
+                    deltas: list[GraphDelta] = []
+                    graph.subscribe(deltas.append)
+                    with graph.batch():
+                        count = ConcurrentRewriter(
+                            [_OwnedProduction(p, tile) for p in productions], max_workers=1
+                        ).run(graph)
+                    for delta in deltas:
+                        store.apply_delta(delta, graph)
+                    sweep_applied += count
+        applied += sweep_applied
+        if not sweep_applied:
+            break
+    return applied
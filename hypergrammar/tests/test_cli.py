@@ -0,0 +1,178 @@
+import json
+import random
+import subprocess
+import sys
+
+from hypergrammar.cli import main
+from hypergrammar.edge import EdgeType
+from hypergrammar.meshes import hex_grid
+from hypergrammar.mesh_io import load_mesh, save_mesh
+
+
+class RejectAll:
+    def is_valid(self, edge, hypergraph, meta=None):
+        return False
+
+
+class TestCli:
+    """Test suite for the batch refinement command line."""
+
+    def test_mesh_round_trip(self, tmp_path):
+        """Test that saved meshes load back unchanged."""
+        # Arrange
+        hg = hex_grid(2, 2, random.Random(0))
+
+        # Act
+        save_mesh(hg, tmp_path / "mesh.json")
+        loaded = load_mesh(tmp_path / "mesh.json")
+
+        # Assert
+        assert loaded.get_edges() == hg.get_edges()
+        assert loaded.get_vertex_parameters("1_0") == {"x": 1, "y": 0}
+
+    def test_refines_to_fixpoint_and_reports(self, tmp_path):
+        """Test that the CLI refines every hexagon and writes a report."""
+        # Arrange
+        save_mesh(hex_grid(3, 2), tmp_path / "in.json")
+
+        # Act
+        code = main([
+            str(tmp_path / "in.json"),
+            str(tmp_path / "out.json"),
+            "--report",
+            str(tmp_path / "report.json"),
+        ])
+
+        # Assert
+        assert code == 0
+        refined = load_mesh(tmp_path / "out.json")
+        assert all(e.get_parameters()["R"] == 1 for e in refined.get_edges())
+        report = json.loads((tmp_path / "report.json").read_text())
+        assert report["productions"]["prod9"]["applied"] == 6
+        assert report["rewrites"] == report["steps"]
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        """Test that --workers produces the same mesh as the sequential run."""
+        # Arrange
+        save_mesh(hex_grid(4, 3, random.Random(5)), tmp_path / "in.json")
+
+        # Act
+        main([str(tmp_path / "in.json"), str(tmp_path / "seq.json")])
+        main([str(tmp_path / "in.json"), str(tmp_path / "par.json"), "-w", "4"])
+
+        # Assert
+        seq = load_mesh(tmp_path / "seq.json").get_edges()
+        assert load_mesh(tmp_path / "par.json").get_edges() == seq
+
+    def test_steps_and_rfc(self, tmp_path):
+        """Test that --steps limits the run and --rfc evaluations are counted."""
+        # Arrange
+        save_mesh(hex_grid(3, 1), tmp_path / "in.json")
+
+        # Act
+        main([
+            str(tmp_path / "in.json"),
+            str(tmp_path / "out.json"),
+            "-n",
+            "1",
+            "--report",
+            str(tmp_path / "limited.json"),
+        ])
+        main([
+            str(tmp_path / "in.json"),
+            str(tmp_path / "out.json"),
+            "--rfc",
+            f"{__name__}:RejectAll",
+            "--report",
+            str(tmp_path / "rejected.json"),
+        ])
+
+        # Assert
+        limited = json.loads((tmp_path / "limited.json").read_text())
+        rejected = json.loads((tmp_path / "rejected.json").read_text())
+        assert limited["rewrites"] == 1
+        assert rejected["rewrites"] == 0
+        assert rejected["rfc_evaluations"] == 3
+        q_edges = [
+            e for e in load_mesh(tmp_path / "out.json").get_edges()
+            if e.get_type() == EdgeType.Q
+        ]
+        assert all(e.get_parameters()["R"] == 0 for e in q_edges)
+
+    def test_unknown_production(self, tmp_path):
+        """Test that an unknown production name is reported as an error."""
+        # Arrange
+        save_mesh(hex_grid(1, 1), tmp_path / "in.json")
+
+        # Act
+        code = main([str(tmp_path / "in.json"), str(tmp_path / "out.json"), "-p", "prod42"])
+
+        # Assert
+        assert code == 1
+
+    def test_bad_rfc_and_mesh_are_reported(self, tmp_path, capsys):
+        """Test that bad --rfc values and malformed meshes exit with an error message."""
+        # Arrange
+        save_mesh(hex_grid(1, 1), tmp_path / "in.json")
+        (tmp_path / "bad.json").write_text(json.dumps({"edges": [{"type": "E"}]}))
+        out = str(tmp_path / "out.json")
+
+        # Act
+        codes = [
+            main([str(tmp_path / "in.json"), out, "--rfc", "no_such_module:RFC"]),
+            main([str(tmp_path / "in.json"), out, "--rfc", "json:NoSuchRFC"]),
+            main([str(tmp_path / "bad.json"), out]),
+        ]
+
+        # Assert
+        assert codes == [1, 1, 1]
+        errors = capsys.readouterr().err
+        assert "no_such_module" in errors
+        assert "NoSuchRFC" in errors
+        assert "without vertices" in errors
+
+    def test_malformed_mesh_shapes_are_reported(self, tmp_path, capsys):
+        """Test that wrongly typed mesh sections and values exit with an error message."""
+        # Arrange
+        edge = {"type": "E", "vertices": ["A", "B"]}
+        meshes = [
+            {"edges": 5},
+            {"vertices": []},
+            {"edges": [{"type": "E", "vertices": "ab"}]},
+            {"edges": [{**edge, "parameters": {"R": "x"}}]},
+            {"edges": [{**edge, "parameters": {"R": True}}]},
+            {"edges": [edge], "vertices": {"A": {"x": 1.5}}},
+            {"edges": [{"type": ["E"], "vertices": ["A", "B"]}]},
+        ]
+        paths = []
+        for i, mesh in enumerate(meshes):
+            path = tmp_path / f"bad{i}.json"
+            path.write_text(json.dumps(mesh))
+            paths.append(path)
+
+        # Act
+        codes = [main([str(path), str(tmp_path / "out.json")]) for path in paths]
+
+        # Assert
+        assert codes == [1] * len(meshes)
+        errors = capsys.readouterr().err
+        assert errors.count("hypergrammar: error:") == len(meshes)
+        assert "Traceback" not in errors
+        assert not (tmp_path / "out.json").exists()
+
+    def test_module_entry_point(self, tmp_path):
+        """Test that the package runs as `python -m hypergrammar`."""
+        # Arrange
+        save_mesh(hex_grid(1, 1), tmp_path / "in.json")
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-m", "hypergrammar", str(tmp_path / "in.json"), str(tmp_path / "out.json")],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        # Assert
+        assert result.returncode == 0
+        assert "rewrites" in result.stderr
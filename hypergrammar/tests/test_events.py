@@ -0,0 +1,80 @@
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.productions.prod_10 import Prod10
+
+
+class TestGraphEvents:
+    """Test suite for the Hypergraph delta stream."""
+
+    def test_single_mutations_emit_deltas(self):
+        """Test that each mutation outside a batch emits its own delta."""
+        # Arrange
+        hg = Hypergraph()
+        deltas = []
+        hg.subscribe(deltas.append)
+        edge = Edge(EdgeType.E, frozenset({"A", "B"}))
+
+        # Act
+        hg.add_edge(edge)
+        hg.add_edge(edge)  # already present, no change
+        hg.set_vertex_parameter("A", {"x": 0, "y": 0})
+        hg.remove_edge(edge)
+
+        # Assert
+        assert len(deltas) == 3
+        assert deltas[0].added == frozenset([edge])
+        assert deltas[1].vertex_parameters == {"A": {"x": 0, "y": 0}}
+        assert deltas[2].removed == frozenset([edge])
+
+    def test_batch_compacts_changes(self):
+        """Test that a batch emits one delta and drops changes that cancel out."""
+        # Arrange
+        hg = Hypergraph()
+        deltas = []
+        hg.subscribe(deltas.append)
+        kept = Edge(EdgeType.E, frozenset({"A", "B"}))
+        temporary = Edge(EdgeType.E, frozenset({"B", "C"}))
+
+        # Act
+        with hg.batch():
+            hg.add_edge(kept)
+            hg.add_edge(temporary)
+            hg.remove_edge(temporary)
+
+        # Assert
+        assert len(deltas) == 1
+        assert deltas[0].added == frozenset([kept])
+        assert deltas[0].removed == frozenset()
+
+    def test_production_application_is_one_delta(self):
+        """Test that P10 reports all re-marked boundary edges in a single delta."""
+        # Arrange
+        hg = Hypergraph()
+        nodes = [f"v{i}" for i in range(6)]
+        hg.add_edge(Edge(EdgeType.Q, frozenset(nodes), {"R": 1}))
+        for i in range(6):
+            hg.add_edge(Edge(EdgeType.E, frozenset([nodes[i], nodes[(i + 1) % 6]]), {"R": 0}))
+        deltas = []
+        hg.subscribe(deltas.append)
+
+        # Act
+        Prod10().apply(hg)
+
+        # Assert
+        assert len(deltas) == 1
+        assert len(deltas[0].added) == 6
+        assert len(deltas[0].removed) == 6
+
+    def test_unsubscribe(self):
+        """Test that an unsubscribed observer receives nothing."""
+        # Arrange
+        hg = Hypergraph()
+        deltas = []
+        unsubscribe = hg.subscribe(deltas.append)
+
+        # Act
+        unsubscribe()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
+
+        # Assert
+        assert not deltas
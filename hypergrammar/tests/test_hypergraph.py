@@ -0,0 +1,154 @@
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.meshes import quad_grid
+
+
+class TestHypergraphBulkParameters:
+    """Test suite for parameter-based bulk queries and updates."""
+
+    def test_select_by_type_and_parameters(self):
+        """Test that selections combine type, parameter and predicate filters."""
+        # Arrange
+        hg = Hypergraph()
+        e_marked = Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1, "B": 0})
+        e_boundary = Edge(EdgeType.E, frozenset({"B", "C"}), {"R": 1, "B": 1})
+        e_plain = Edge(EdgeType.E, frozenset({"C", "A"}), {"R": 0})
+        q = Edge(EdgeType.Q, frozenset({"A", "B", "C"}), {"R": 1})
+        for edge in (e_marked, e_boundary, e_plain, q):
+            hg.add_edge(edge)
+
+        # Act & Assert
+        assert hg.select_edges(EdgeType.E, R=1) == {e_marked, e_boundary}
+        assert hg.select_edges(R=1, B=1) == {e_boundary}
+        assert hg.select_edges(EdgeType.Q) == {q}
+        assert hg.select_edges(predicate=lambda e: "A" in e.get_vertices()) == {
+            e_marked,
+            e_plain,
+            q,
+        }
+        assert hg.select_edges(EdgeType.E, R=2) == frozenset()
+
+    def test_index_follows_removals(self):
+        """Test that removed edges disappear from selections."""
+        # Arrange
+        hg = Hypergraph()
+        edge = Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1})
+        hg.add_edge(edge)
+
+        # Act
+        hg.remove_edge(edge)
+
+        # Assert
+        assert hg.select_edges(EdgeType.E, R=1) == frozenset()
+
+    def test_bulk_clear_flags(self):
+        """Test that clearing every R flag touches the whole selection in one delta."""
+        # Arrange
+        hg = quad_grid(4, 4)
+        hg.update_parameters(hg.select_edges(EdgeType.E), {"R": 1})
+        deltas = []
+        hg.subscribe(deltas.append)
+
+        # Act
+        updated = hg.update_parameters(hg.select_edges(R=1), {"R": 0})
+
+        # Assert
+        assert len(updated) == 40
+        assert hg.select_edges(R=1) == frozenset()
+        assert len(hg.select_edges(EdgeType.E, R=0)) == 40
+        assert len(deltas) == 1
+
+    def test_update_removes_parameter(self):
+        """Test that a None value drops the parameter."""
+        # Arrange
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1, "B": 1}))
+
+        # Act
+        (updated,) = hg.update_parameters(hg.get_edges(), {"B": None})
+
+        # Assert
+        assert updated.get_parameters() == {"R": 1}
+        assert hg.get_edges() == {updated}
+        assert hg.select_edges(B=1) == frozenset()
+
+
+class TestHypergraphStats:
+    """Test suite for the running aggregate statistics."""
+
+    def test_counts_follow_mutations(self):
+        """Test that counts per type, parameter and colour track edits."""
+        # Arrange
+        hg = quad_grid(2, 2)
+
+        # Act
+        hg.update_parameters(
+            hg.select_edges(EdgeType.E, predicate=lambda e: "0_0" in e.get_vertices()),
+            {"R": 1},
+        )
+        stats = hg.get_stats()
+
+        # Assert
+        assert stats.count(EdgeType.Q) == 4
+        assert stats.count(EdgeType.E) == 12
+        assert stats.count(EdgeType.E, "R", 1) == 2
+        assert stats.count(EdgeType.E, "R", 0) == 10
+        assert stats.colour_counts[(EdgeType.E, "red")] == 2
+
+    def test_marked_area(self):
+        """Test that the marked element area follows Q re-marking."""
+        # Arrange
+        hg = quad_grid(3, 2)
+
+        # Act
+        before = hg.get_stats()
+        hg.update_parameters(
+            hg.select_edges(EdgeType.Q, predicate=lambda e: "0_0" in e.get_vertices()),
+            {"R": 1},
+        )
+        after = hg.get_stats()
+
+        # Assert
+        assert before.element_area == 6.0
+        assert before.marked_area == 0.0
+        assert after.marked_area == 1.0
+        assert after.element_area == 6.0
+
+    def test_area_follows_vertex_moves(self):
+        """Test that moving a vertex updates the area of its elements."""
+        # Arrange
+        hg = quad_grid(1, 1)
+
+        # Act
+        hg.set_vertex_parameter("1_1", {"x": 2, "y": 2})
+
+        # Assert
+        assert hg.get_stats().element_area == 2.0
+
+    def test_non_positional_update_keeps_area(self):
+        """Test that changing other vertex parameters leaves the area as it was."""
+        # Arrange
+        hg = quad_grid(1, 1)
+
+        # Act
+        hg.set_vertex_parameter("1_1", {"x": 1, "y": 1, "w": 5})
+
+        # Assert
+        assert hg.get_stats().element_area == 1.0
+
+    def test_stats_match_full_scan(self):
+        """Test that running counts equal a full recount after many edits."""
+        # Arrange
+        hg = quad_grid(5, 5)
+        for edge in list(hg.select_edges(EdgeType.E))[:20]:
+            hg.remove_edge(edge)
+
+        # Act
+        stats = hg.get_stats()
+
+        # Assert
+        edges = hg.get_edges()
+        assert stats.count(EdgeType.E) == sum(e.get_type() == EdgeType.E for e in edges)
+        assert stats.count(EdgeType.Q, "R", 0) == sum(
+            e.get_type() == EdgeType.Q and e.get_parameters().get("R") == 0 for e in edges
+        )
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+CORE_MODULES = [
+    "hypergrammar.edge",
+    "hypergrammar.hypergraph",
+    "hypergrammar.signature",
+    "hypergrammar.productions.prod_0",
+    "hypergrammar.productions.prod_9",
+    "hypergrammar.productions.prod_10",
+]
+
+PLOTTING_MODULES = ["xgi", "networkx", "matplotlib", "numpy", "scipy"]
+
+# generous wall clock budget for a cold import, catches heavy imports sneaking back
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+class TestImportTime:
+    """Benchmark guarding the import cost of the core package."""
+
+    def test_core_does_not_load_plotting_backends(self):
+        """Test that importing the core leaves plotting backends unloaded."""
+        # Act
+        loaded = _run(
+            "import sys\n"
+            f"for m in {CORE_MODULES!r}: __import__(m)\n"
+            f"print(','.join(m for m in {PLOTTING_MODULES!r} if m in sys.modules))"
+        )
+
+        # Assert
+        assert loaded == "", f"core import pulled in: {loaded}"
+
+    def test_core_import_time_budget(self):
+        """Test that importing the core stays within the time budget."""
+        # Act
+        elapsed = float(
+            _run(
+                "import time\n"
+                "start = time.perf_counter()\n"
+                f"for m in {CORE_MODULES!r}: __import__(m)\n"
+                "print(time.perf_counter() - start)"
+            )
+        )
+
+        # Assert
+        assert elapsed < IMPORT_BUDGET_SECONDS, f"core import took {elapsed:.3f}s"
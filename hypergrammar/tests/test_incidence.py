@@ -0,0 +1,118 @@
+import pytest
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.meshes import quad_grid
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+# pylint: disable=wrong-import-position
+from hypergrammar.incidence import IncidenceArrays
+
+
+class TestIncidenceArrays:
+    """Test suite for the sparse incidence export."""
+
+    def test_incidence_matrix_shape_and_degrees(self):
+        """Test that every edge column holds one entry per edge vertex."""
+        # Arrange
+        hg = quad_grid(2, 2)
+
+        # Act
+        arrays = IncidenceArrays.from_hypergraph(hg)
+        csr = arrays.to_csr()
+
+        # Assert
+        assert csr.shape == (9, 4 + 12)
+        column_sizes = np.asarray(csr.sum(axis=0)).ravel()
+        expected = [len(e.get_vertices()) for e in arrays.edges]
+        assert column_sizes.tolist() == expected
+
+    def test_numbering_is_stable(self):
+        """Test that vertex and edge numbering does not depend on insertion order."""
+        # Act
+        first = IncidenceArrays.from_hypergraph(quad_grid(3, 2))
+        second = IncidenceArrays.from_hypergraph(quad_grid(3, 2))
+
+        # Assert
+        assert first.vertices == second.vertices
+        assert first.edges == second.edges
+        assert (first.rows == second.rows).all()
+
+    def test_parameter_columns(self):
+        """Test that parameter columns follow the numbering and mark missing values."""
+        # Arrange
+        hg = quad_grid(1, 1)
+
+        # Act
+        arrays = IncidenceArrays.from_hypergraph(hg)
+
+        # Assert
+        q_index = next(i for i, e in enumerate(arrays.edges) if e.get_type() == EdgeType.Q)
+        assert arrays.edge_parameters["R"][q_index] == 0
+        assert arrays.edge_parameter_masks["R"][q_index]
+        assert not arrays.edge_parameter_masks["B"][q_index]
+        assert arrays.vertex_parameters["x"].tolist() == [0, 0, 1, 1]
+
+    def test_e_adjacency(self):
+        """Test that E adjacency is symmetric and counts grid neighbours."""
+        # Arrange
+        arrays = IncidenceArrays.from_hypergraph(quad_grid(2, 2))
+
+        # Act
+        adjacency = arrays.e_adjacency()
+
+        # Assert
+        assert (adjacency != adjacency.T).nnz == 0
+        degrees = np.asarray(adjacency.sum(axis=1)).ravel()
+        centre = arrays.vertices.index("1_1")
+        assert degrees[centre] == 4
+        assert degrees.sum() == 2 * 12
+
+    def test_round_trip_through_sparse_matrix(self):
+        """Test that the reverse constructor rebuilds the original graph."""
+        # Arrange
+        hg = quad_grid(3, 3)
+        arrays = IncidenceArrays.from_hypergraph(hg)
+
+        # Act
+        rebuilt = IncidenceArrays.from_sparse(
+            arrays.to_csr(),
+            arrays.vertices,
+            arrays.edge_types,
+            arrays.edge_parameters,
+            arrays.vertex_parameters,
+            arrays.edge_parameter_masks,
+            arrays.vertex_parameter_masks,
+        ).to_hypergraph()
+
+        # Assert
+        assert rebuilt.get_edges() == hg.get_edges()
+        assert rebuilt.get_vertex_parameters("2_3") == {"x": 2, "y": 3}
+
+    def test_round_trip_keeps_negative_values(self):
+        """Test that -1 survives as a value and absent parameters stay absent."""
+        # Arrange
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": -1}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"B", "C"}), {"B": 0}))
+        hg.set_vertex_parameter("A", {"x": -1, "y": 0})
+        hg.set_vertex_parameter("B", {"x": 0})
+        arrays = IncidenceArrays.from_hypergraph(hg)
+
+        # Act
+        rebuilt = IncidenceArrays.from_sparse(
+            arrays.to_coo(),
+            arrays.vertices,
+            arrays.edge_types,
+            arrays.edge_parameters,
+            arrays.vertex_parameters,
+            arrays.edge_parameter_masks,
+            arrays.vertex_parameter_masks,
+        ).to_hypergraph()
+
+        # Assert
+        assert rebuilt.get_edges() == hg.get_edges()
+        assert rebuilt.get_vertex_parameters("A") == {"x": -1, "y": 0}
+        assert rebuilt.get_vertex_parameters("B") == {"x": 0}
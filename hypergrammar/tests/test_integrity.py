@@ -0,0 +1,111 @@
+import pytest
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.integrity import check_integrity, deduplicate_e_edges
+from hypergrammar.meshes import quad_grid
+
+
+class TestIntegrity:
+    """Test suite for mesh integrity checks and E edge deduplication."""
+
+    def test_generated_mesh_is_valid(self):
+        """Test that a generated mesh has nothing to report."""
+        # Act
+        report = check_integrity(quad_grid(5, 5))
+
+        # Assert
+        assert report.is_valid()
+        assert report.summary() == "ok"
+
+    def test_reports_every_problem(self):
+        """Test duplicates, malformed edges, open elements and dangling vertices."""
+        # Arrange
+        hg = quad_grid(2, 1)
+        duplicate = Edge(EdgeType.E, frozenset({"0_0", "1_0"}), {"R": 1, "B": 0})
+        malformed = Edge(EdgeType.E, frozenset({"0_0", "1_0", "2_0"}), {"R": 0})
+        (removed,) = hg.get_e_edges("2_0", "2_1")
+        hg.add_edge(duplicate)
+        hg.add_edge(malformed)
+        hg.remove_edge(removed)
+        hg.set_vertex_parameter("lonely", {"x": 9, "y": 9})
+
+        # Act
+        report = check_integrity(hg)
+
+        # Assert
+        pair = frozenset({"0_0", "1_0"})
+        assert set(report.duplicate_e_edges) == {pair}
+        assert duplicate in report.duplicate_e_edges[pair]
+        assert report.malformed_e_edges == {malformed}
+        assert [sorted(q.get_vertices()) for q in report.open_elements] == [
+            ["1_0", "1_1", "2_0", "2_1"]
+        ]
+        assert report.dangling_vertices == {"lonely"}
+        assert "1 duplicate E edge pairs: 0_0-1_0" in report.summary()
+
+    def test_summary_truncates_examples(self):
+        """Test that big reports list counts and only a few examples."""
+        # Arrange
+        hg = Hypergraph()
+        for i in range(10):
+            hg.set_vertex_parameter(f"v{i}", {})
+
+        # Act
+        summary = check_integrity(hg).summary(limit=2)
+
+        # Assert
+        assert summary == "10 dangling vertices: v0, v1, ... (8 more)"
+
+    def test_deduplicate_merges_parameters(self):
+        """Test that duplicates collapse into one edge keeping the marks."""
+        # Arrange
+        hg = quad_grid(1, 1)
+        hg.add_edge(Edge(EdgeType.E, frozenset({"0_0", "1_0"}), {"R": 1, "B": 0}))
+
+        # Act
+        merged = deduplicate_e_edges(hg)
+
+        # Assert
+        assert merged == [Edge(EdgeType.E, frozenset({"0_0", "1_0"}), {"R": 1, "B": 0})]
+        assert hg.get_e_edges("1_0", "0_0") == set(merged)
+        assert check_integrity(hg).is_valid()
+
+
+class TestStrictEEdges:
+    """Test suite for the enforcing E edge mode of `Hypergraph`."""
+
+    def test_strict_rejects_second_e_edge(self):
+        """Test that a second E edge on the same pair raises in strict mode."""
+        # Arrange
+        hg = Hypergraph(strict_e_edges=True)
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 0}))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            hg.add_edge(Edge(EdgeType.E, frozenset({"B", "A"}), {"R": 1}))
+        assert len(hg.get_edges()) == 1
+
+    def test_strict_allows_parameter_updates(self):
+        """Test that replacing an E edge through updates stays allowed."""
+        # Arrange
+        hg = Hypergraph(strict_e_edges=True)
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 0}))
+
+        # Act
+        hg.update_parameters(hg.get_edges(), {"R": 1})
+
+        # Assert
+        assert hg.get_e_edges("A", "B") == {Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1})}
+
+    def test_default_mode_keeps_duplicates(self):
+        """Test that duplicates are still accepted without strict mode."""
+        # Arrange
+        hg = Hypergraph()
+
+        # Act
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 0}))
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"}), {"R": 1}))
+
+        # Assert
+        assert len(hg.get_e_edges("A", "B")) == 2
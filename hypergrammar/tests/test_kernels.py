@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.meshes import hex_grid, quad_grid
+from hypergrammar.signature import boundary_cycle
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from hypergrammar.kernels import EdgeKeyIndex, cycle_templates, pack_pairs
+
+
+class TestKernels:
+    """Test suite for the integer-keyed boundary validation kernels."""
+
+    def test_pack_pairs_is_unordered(self):
+        """Test that a pair packs to the same key in either order."""
+        # Act
+        keys = pack_pairs([1, 7, 2**31], [7, 1, 3])
+
+        # Assert
+        assert keys[0] == keys[1]
+        assert keys[2] == (3 << 32) | 2**31
+
+    def test_cycle_templates_are_distinct_cycles(self):
+        """Test that templates enumerate each undirected cycle once."""
+        # Act & Assert
+        assert cycle_templates(4).shape == (3, 4)
+        assert cycle_templates(6).shape == (60, 6)
+
+    def test_validate_cycles(self):
+        """Test row-wise validation of ordered vertex id cycles."""
+        # Arrange
+        hg = quad_grid(1, 1)
+        index = EdgeKeyIndex(hg)
+        ids = [index.vertex_ids[v] for v in ("0_0", "1_0", "1_1", "0_1")]
+
+        # Act
+        result = index.validate_cycles([ids, [ids[0], ids[2], ids[1], ids[3]]])
+
+        # Assert
+        assert result.tolist() == [True, False]
+
+    @pytest.mark.parametrize("build", [quad_grid, hex_grid], ids=["quads", "hexes"])
+    def test_matches_boundary_cycle(self, build):
+        """Test that batch validation agrees with the per-element cycle walk."""
+        # Arrange
+        rng = random.Random(0)
+        hg = build(6, 6)
+        e_edges = sorted(hg.select_edges(EdgeType.E), key=lambda e: sorted(e.get_vertices()))
+        for edge in rng.sample(e_edges, 10):
+            hg.remove_edge(edge)
+        elements = sorted(hg.select_edges(EdgeType.Q), key=lambda e: sorted(e.get_vertices()))
+
+        # Act
+        closed = EdgeKeyIndex(hg).closed_boundaries(elements)
+
+        # Assert
+        expected = [boundary_cycle(hg, q.get_vertices()) is not None for q in elements]
+        assert closed.tolist() == expected
+        assert not all(expected)
+
+    def test_unknown_vertices_and_empty_graph(self):
+        """Test that elements outside the index are never closed."""
+        # Arrange
+        index = EdgeKeyIndex(Hypergraph())
+        q = Edge(EdgeType.Q, frozenset({"A", "B", "C", "D"}), {"R": 0})
+
+        # Act & Assert
+        assert index.closed_boundaries([q]).tolist() == [False]
+        assert index.has_pairs([0], [1]).tolist() == [False]
@@ -0,0 +1,136 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.parallel import ConcurrentRewriter, claim_regions
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.productions.prod_10 import Prod10
+from hypergrammar.productions.rewrite import Rewrite
+
+
+def _hex_strip(count: int) -> Hypergraph:
+    """Row of hexagons, neighbours share one E edge."""
+    hg = Hypergraph()
+    for h in range(count):
+        # shared edge with the previous hexagon is (a{h}, b{h})
+        ring = [f"a{h}", f"t{h}", f"a{h + 1}", f"b{h + 1}", f"u{h}", f"b{h}"]
+        hg.add_edge(Edge(EdgeType.Q, frozenset(ring), {"R": 0}))
+        for i in range(6):
+            hg.add_edge(Edge(EdgeType.E, frozenset([ring[i], ring[(i + 1) % 6]]), {"R": 0}))
+    return hg
+
+
+def _quad_grid(size: int) -> Hypergraph:
+    hg = Hypergraph()
+    for x in range(size):
+        for y in range(size):
+            corners = [f"{x}_{y}", f"{x + 1}_{y}", f"{x + 1}_{y + 1}", f"{x}_{y + 1}"]
+            hg.add_edge(Edge(EdgeType.Q, frozenset(corners), {"R": 0}))
+            for i in range(4):
+                hg.add_edge(Edge(EdgeType.E, frozenset([corners[i], corners[(i + 1) % 4]])))
+    return hg
+
+
+def _sequential(graph: Hypergraph, productions) -> Hypergraph:
+    progress = True
+    while progress:
+        progress = False
+        for production in productions:
+            while production.apply(graph) is not None:
+                progress = True
+    return graph
+
+
+class EvenHexagonsRFC:
+    """Refines only hexagons whose first vertex has an even index."""
+
+    def is_valid(self, edge, hypergraph, meta=None):
+        return int(min(edge.get_vertices())[1:]) % 2 == 0
+
+
+class TestConcurrentRewriter:
+    """Test suite for concurrent application of productions."""
+
+    def test_claim_regions_defers_overlaps(self):
+        """Test that overlapping regions are deferred, disjoint ones accepted."""
+        # Arrange
+        r1 = Rewrite(frozenset({"A", "B"}), frozenset(), frozenset())
+        r2 = Rewrite(frozenset({"B", "C"}), frozenset(), frozenset())
+        r3 = Rewrite(frozenset({"D"}), frozenset(), frozenset())
+
+        # Act
+        accepted, deferred = claim_regions([r1, r2, r3])
+
+        # Assert
+        assert accepted == [r1, r3]
+        assert deferred == [r2]
+
+    def test_hex_strip_matches_sequential(self):
+        """Test that P9/P10 on adjacent hexagons match a sequential derivation."""
+        # Arrange
+        productions = [Prod9(), Prod10()]
+        expected = _sequential(_hex_strip(5), productions).get_edges()
+        hg = _hex_strip(5)
+        rewriter = ConcurrentRewriter(productions, max_workers=4)
+
+        # Act
+        applied = rewriter.run(hg)
+
+        # Assert
+        assert hg.get_edges() == expected
+        assert applied == 10
+        assert rewriter.conflicts > 0
+
+    def test_quad_grid_matches_sequential(self):
+        """Test that P0 on a quad grid matches a sequential derivation."""
+        # Arrange
+        expected = _sequential(_quad_grid(4), [Prod0()]).get_edges()
+        hg = _quad_grid(4)
+
+        # Act
+        applied = ConcurrentRewriter([Prod0()], max_workers=4).run(hg)
+
+        # Assert
+        assert hg.get_edges() == expected
+        assert applied == 16
+
+    def test_max_rounds(self):
+        """Test that the rewriter stops after the requested number of rounds."""
+        # Arrange
+        hg = _hex_strip(3)
+        rewriter = ConcurrentRewriter([Prod9(), Prod10()])
+
+        # Act
+        rewriter.run(hg, max_rounds=1)
+
+        # Assert
+        assert rewriter.rounds == 1
+        marked = [
+            e for e in hg.get_edges()
+            if e.get_type() == EdgeType.Q and e.get_parameters()["R"] == 1
+        ]
+        # neighbouring hexagons share vertices, so one round cannot mark all
+        assert 1 <= len(marked) < 3
+
+    def test_process_pool_matches_sequential(self):
+        """Test that matching in worker processes gives the sequential result."""
+        # Arrange
+        expected_hexes = _hex_strip(5)
+        expected_hexes.set_rfc(EvenHexagonsRFC())
+        _sequential(expected_hexes, [Prod9(), Prod10()])
+        expected_quads = _sequential(_quad_grid(4), [Prod0()]).get_edges()
+        hexes = _hex_strip(5)
+        hexes.set_rfc(EvenHexagonsRFC())
+        quads = _quad_grid(4)
+
+        # Act
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+            ConcurrentRewriter([Prod9(), Prod10()], executor=pool).run(hexes)
+            applied = ConcurrentRewriter([Prod0()], executor=pool).run(quads)
+
+        # Assert
+        assert hexes.get_edges() == expected_hexes.get_edges()
+        assert quads.get_edges() == expected_quads
+        assert applied == 16
@@ -0,0 +1,142 @@
+import multiprocessing
+import subprocess
+import sys
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.shared import SharedHypergraph
+from hypergrammar.signature import boundary_cycle, local_signature
+
+
+def _build_graph() -> Hypergraph:
+    hg = Hypergraph()
+    names = ["A", "B", "C", "D"]
+    for i in range(4):
+        hg.add_edge(Edge(EdgeType.E, frozenset([names[i], names[(i + 1) % 4]]), {"B": 1}))
+    hg.add_edge(Edge(EdgeType.Q, frozenset(names), {"R": 0}))
+    for i, name in enumerate(names):
+        hg.set_vertex_parameter(name, {"x": i % 2, "y": i // 2})
+    return hg
+
+
+def _count_q_edges(name: str) -> int:
+    with SharedHypergraph.attach(name) as view:
+        return sum(1 for e in view.get_edges() if e.get_type() == EdgeType.Q)
+
+
+class TestSharedHypergraph:
+    """Test suite for the shared memory export."""
+
+    def test_round_trip(self):
+        """Test that the shared view exposes the same edges and parameters."""
+        # Arrange
+        hg = _build_graph()
+
+        # Act
+        view = SharedHypergraph.export(hg)
+        try:
+            attached = SharedHypergraph.attach(view.name)
+            edges = attached.get_edges()
+            params = attached.get_vertex_parameters("D")
+            incident = attached.get_incident_edges("A")
+            attached.close()
+        finally:
+            view.close()
+            view.unlink()
+
+        # Assert
+        assert edges == hg.get_edges()
+        assert params == {"x": 1, "y": 1}
+        assert incident == hg.get_incident_edges("A")
+
+    def test_decoded_edges_are_reused(self):
+        """Test that repeated reads return the already decoded edges."""
+        # Arrange
+        hg = _build_graph()
+
+        # Act
+        with SharedHypergraph.export(hg) as view:
+            first = view.get_edges()
+            incident = view.get_incident_edges("A")
+            rows = view.incident_edge_indexes("A")
+            same = view.get_edges() is first and view.get_incident_edges("A") is incident
+            shared_objects = {id(e) for e in incident} <= {id(e) for e in first}
+            view.unlink()
+
+        # Assert
+        assert same
+        assert shared_objects
+        assert len(rows) == 3
+
+    def test_signature_on_shared_view(self):
+        """Test that local signatures read the same boundary from a shared view."""
+        # Arrange
+        hg = _build_graph()
+        (q_edge,) = [e for e in hg.get_edges() if e.get_type() == EdgeType.Q]
+        cycle = boundary_cycle(hg, q_edge.get_vertices())
+
+        # Act
+        with SharedHypergraph.export(hg) as view:
+            pair = view.get_e_edges("B", "A")
+            signature = local_signature(view, q_edge, cycle)
+            view.unlink()
+
+        # Assert
+        assert pair == hg.get_e_edges("A", "B")
+        assert signature == local_signature(hg, q_edge, cycle)
+
+    def test_to_hypergraph(self):
+        """Test that a view can be copied back into a mutable Hypergraph."""
+        # Arrange
+        hg = _build_graph()
+
+        # Act
+        with SharedHypergraph.export(hg) as view:
+            copy = view.to_hypergraph()
+            view.unlink()
+
+        # Assert
+        assert copy.get_edges() == hg.get_edges()
+        assert copy.get_vertex_parameters("B") == hg.get_vertex_parameters("B")
+
+    def test_attach_from_worker_process(self):
+        """Test that worker processes can attach to the block by name."""
+        # Arrange
+        hg = _build_graph()
+
+        # Act
+        with SharedHypergraph.export(hg) as view:
+            with multiprocessing.get_context("spawn").Pool(2) as pool:
+                counts = pool.map(_count_q_edges, [view.name, view.name])
+            view.unlink()
+
+        # Assert
+        assert counts == [1, 1]
+
+    def test_independent_worker_does_not_unlink(self):
+        """Test that a worker outside our process tree leaves the block alive."""
+        # Arrange
+        hg = _build_graph()
+        worker = (
+            "import sys\n"
+            "from hypergrammar.shared import SharedHypergraph\n"
+            "with SharedHypergraph.attach(sys.argv[1]) as view:\n"
+            "    print(len(view.get_edges()))\n"
+        )
+
+        # Act
+        with SharedHypergraph.export(hg) as view:
+            result = subprocess.run(
+                [sys.executable, "-c", worker, view.name],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            with SharedHypergraph.attach(view.name) as again:
+                edges = again.get_edges()
+            view.unlink()
+
+        # Assert
+        assert result.stdout.strip() == "5"
+        assert "leaked" not in result.stderr
+        assert edges == hg.get_edges()
@@ -0,0 +1,122 @@
+import os
+import subprocess
+import sys
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.signature import (
+    boundary_cycle,
+    graph_signature,
+    local_signature,
+)
+
+
+def _quad(names: list[str], q_r: int = 0, e_r: list[int] | None = None) -> Hypergraph:
+    hg = Hypergraph()
+    e_r = e_r or [0, 0, 0, 0]
+    for i in range(4):
+        hg.add_edge(
+            Edge(EdgeType.E, frozenset([names[i], names[(i + 1) % 4]]), {"R": e_r[i]})
+        )
+    hg.add_edge(Edge(EdgeType.Q, frozenset(names), {"R": q_r}))
+    return hg
+
+
+def _q_edge(hg: Hypergraph) -> Edge:
+    return next(e for e in hg.get_edges() if e.get_type() == EdgeType.Q)
+
+
+class TestSignature:
+    """Test suite for local and global graph signatures."""
+
+    def test_boundary_cycle_orders_vertices(self):
+        """Test that the boundary walk returns the E cycle in canonical rotation."""
+        # Arrange
+        hg = _quad(["A", "B", "C", "D"])
+
+        # Act
+        cycle = boundary_cycle(hg, frozenset({"A", "B", "C", "D"}))
+
+        # Assert
+        assert cycle in {("A", "B", "C", "D"), ("A", "D", "C", "B")}
+
+    def test_boundary_cycle_missing_edge(self):
+        """Test that an open boundary yields no cycle."""
+        # Arrange
+        hg = _quad(["A", "B", "C", "D"])
+        hg.remove_edge(Edge(EdgeType.E, frozenset({"D", "A"}), {"R": 0}))
+
+        # Act & Assert
+        assert boundary_cycle(hg, frozenset({"A", "B", "C", "D"})) is None
+
+    def test_boundary_cycle_with_chord(self):
+        """Test that a chord across the quad does not hide the outer cycle."""
+        # Arrange
+        hg = _quad(["A", "B", "C", "D"])
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "C"})))
+
+        # Act & Assert
+        assert boundary_cycle(hg, frozenset({"A", "B", "C", "D"})) is not None
+
+    def test_local_signature_ignores_names_and_direction(self):
+        """Test that relabelled and mirrored neighbourhoods share a signature."""
+        # Arrange
+        hg1 = _quad(["A", "B", "C", "D"], e_r=[1, 0, 0, 0])
+        hg2 = _quad(["w", "x", "y", "z"], e_r=[0, 0, 1, 0])
+        q1, q2 = _q_edge(hg1), _q_edge(hg2)
+
+        # Act
+        sig1 = local_signature(hg1, q1, boundary_cycle(hg1, q1.get_vertices()))
+        sig2 = local_signature(hg2, q2, boundary_cycle(hg2, q2.get_vertices()))
+
+        # Assert
+        assert sig1 == sig2
+
+    def test_local_signature_is_parameter_aware(self):
+        """Test that differing boundary parameters give different signatures."""
+        # Arrange
+        hg1 = _quad(["A", "B", "C", "D"], e_r=[1, 0, 0, 0])
+        hg2 = _quad(["A", "B", "C", "D"], e_r=[1, 1, 0, 0])
+        q1, q2 = _q_edge(hg1), _q_edge(hg2)
+
+        # Act
+        sig1 = local_signature(hg1, q1, boundary_cycle(hg1, q1.get_vertices()))
+        sig2 = local_signature(hg2, q2, boundary_cycle(hg2, q2.get_vertices()))
+
+        # Assert
+        assert sig1 != sig2
+
+    def test_graph_signature_is_name_independent(self):
+        """Test that isomorphic graphs hash equal and edited graphs do not."""
+        # Arrange
+        hg1 = _quad(["A", "B", "C", "D"])
+        hg2 = _quad(["p", "q", "r", "s"])
+        hg3 = _quad(["A", "B", "C", "D"], q_r=1)
+
+        # Act & Assert
+        assert graph_signature(hg1) == graph_signature(hg2)
+        assert graph_signature(hg1) != graph_signature(hg3)
+
+    def test_graph_signature_is_stable_across_processes(self):
+        """Test that the signature does not depend on string hash salting."""
+        # Arrange
+        script = (
+            "from hypergrammar.meshes import quad_grid\n"
+            "from hypergrammar.signature import graph_signature\n"
+            "print(graph_signature(quad_grid(3, 3)))\n"
+        )
+
+        # Act
+        results = {
+            subprocess.run(
+                [sys.executable, "-c", script],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            for seed in ("1", "2")
+        }
+
+        # Assert
+        assert len(results) == 1
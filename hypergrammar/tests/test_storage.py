@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from hypergrammar.hypergraph import Hypergraph
+from hypergrammar.edge import Edge, EdgeType
+from hypergrammar.meshes import hex_grid, quad_grid
+from hypergrammar.parallel import ConcurrentRewriter
+from hypergrammar.productions.prod_0 import Prod0
+from hypergrammar.productions.prod_9 import Prod9
+from hypergrammar.productions.prod_10 import Prod10
+from hypergrammar.storage import SQLiteGraphStore, refine_out_of_core
+
+
+class TestSQLiteGraphStore:
+    """Test suite for on-disk storage and tiled refinement."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a stored graph loads back unchanged."""
+        # Arrange
+        hg = quad_grid(3, 3, random.Random(0))
+
+        # Act
+        store = SQLiteGraphStore.from_hypergraph(hg, tmp_path / "mesh.db")
+        loaded = store.to_hypergraph()
+        store.close()
+
+        # Assert
+        assert loaded.get_edges() == hg.get_edges()
+        assert loaded.get_vertex_parameters("3_1") == {"x": 3, "y": 1}
+
+    def test_load_region(self):
+        """Test that a region pages in only the edges around it."""
+        # Arrange
+        store = SQLiteGraphStore.from_hypergraph(quad_grid(4, 4))
+
+        # Act
+        tile = store.load_region((0, 0, 1, 1))
+
+        # Assert
+        q_edges = [e for e in tile.get_edges() if e.get_type() == EdgeType.Q]
+        assert len(q_edges) == 4
+        assert store.edge_count((0, 0, 1, 1)) == len(tile.get_edges())
+
+    def test_vertex_without_position(self):
+        """Test that vertices must carry coordinates."""
+        # Arrange
+        hg = Hypergraph()
+        hg.add_edge(Edge(EdgeType.E, frozenset({"A", "B"})))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            SQLiteGraphStore.from_hypergraph(hg)
+
+    @pytest.mark.parametrize("max_edges", [None, 120])
+    def test_refinement_matches_in_memory(self, max_edges):
+        """Test that tiled P9/P10 refinement equals refining the whole mesh."""
+        # Arrange
+        expected = hex_grid(6, 6, random.Random(3))
+        ConcurrentRewriter([Prod9(), Prod10()]).run(expected)
+        store = SQLiteGraphStore.from_hypergraph(hex_grid(6, 6, random.Random(3)))
+
+        # Act
+        refine_out_of_core(
+            store, [Prod9(), Prod10()], tile_size=4, halo=2, max_edges=max_edges
+        )
+
+        # Assert
+        assert store.to_hypergraph().get_edges() == expected.get_edges()
+
+    def test_quad_refinement_matches_in_memory(self):
+        """Test that tiled P0 refinement equals refining the whole mesh."""
+        # Arrange
+        expected = quad_grid(5, 5, random.Random(1))
+        ConcurrentRewriter([Prod0()]).run(expected)
+        store = SQLiteGraphStore.from_hypergraph(quad_grid(5, 5, random.Random(1)))
+
+        # Act
+        applied = refine_out_of_core(store, [Prod0()], tile_size=2, halo=1)
+
+        # Assert
+        assert applied > 0
+        assert store.to_hypergraph().get_edges() == expected.get_edges()
+
+    def test_halo_must_cover_elements(self):
+        """Test that a halo narrower than the elements is rejected and None picks one."""
+        # Arrange
+        expected = hex_grid(6, 6)
+        ConcurrentRewriter([Prod9(), Prod10()]).run(expected)
+        store = SQLiteGraphStore.from_hypergraph(hex_grid(6, 6))
+
+        # Act
+        with pytest.raises(ValueError):
+            refine_out_of_core(store, [Prod9(), Prod10()], tile_size=4, halo=0)
+        refine_out_of_core(store, [Prod9(), Prod10()], tile_size=4)
+
+        # Assert
+        assert store.element_extent() == 2
+        assert store.to_hypergraph().get_edges() == expected.get_edges()
+
+    def test_memory_ceiling_too_small(self):
+        """Test that an unsatisfiable edge limit is reported."""
+        # Arrange
+        store = SQLiteGraphStore.from_hypergraph(quad_grid(3, 3))
+
+        # Act & Assert
+        with pytest.raises(MemoryError):
+            refine_out_of_core(store, [Prod0()], tile_size=2, halo=1, max_edges=3)
@@ -1,4 +1,6 @@
 import uuid
+from typing import Any, Sequence
+
 from hypergrammar.edge import Edge
 
 
@@ -7,6 +9,20 @@ def canonical_rotation(seq: list[str]) -> tuple[str, ...]:
     return tuple(seq[min_index:] + seq[:min_index])
 
 
+def canonical_dihedral(seq: Sequence[Any]) -> tuple[Any, ...]:
+    """Smallest rotation of `seq` or of its reversal.
+
+    Unlike `canonical_rotation` this also ignores the walking direction, so
+    the same closed cycle read clockwise or counter-clockwise maps to one key.
+    """
+    items = list(seq)
+    candidates = []
+    for ring in (items, items[::-1]):
+        for i in range(len(ring)):
+            candidates.append(tuple(ring[i:] + ring[:i]))
+    return min(candidates, default=())
+
+
 def generate_vertex_name() -> str:
     id_len = 4
     return str(uuid.uuid4())[:id_len]